@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 import uuid
 import asyncio
 import logging
@@ -28,6 +28,7 @@ from ...core.forensics import ForensicsEngine
 from ...core.ocr import OCREngine, create_ocr_engine
 from ...core.rule_engine import load_rule_engine
 from ...core.scoring import RiskScoreCalculator, RiskScoreData
+from ...tasks.resource_monitor import SystemResourceMonitor
 # Removed unused imports - functions only used by deprecated sync endpoint
 from ..deps import get_current_user
 
@@ -166,7 +167,6 @@ async def analyze_check_async_endpoint(
             )
         
         # Check system resources before starting analysis
-        from ...tasks.resource_monitor import SystemResourceMonitor
         system_health = SystemResourceMonitor.check_system_health()
         
         if system_health["status"] == "critical":
@@ -334,13 +334,13 @@ async def list_analyses(
         )
         analyses = result.scalars().all()
         
-        # Get total count
+        # Get total count in the database rather than loading every row
         count_result = await db.execute(
-            select(AnalysisResult)
+            select(func.count(AnalysisResult.id))
             .join(FileRecord)
             .where(FileRecord.user_id == current_user.id)
         )
-        total = len(count_result.scalars().all())
+        total = count_result.scalar_one()
         
         return AnalysisListResponse(
             analyses=[AnalysisResultResponse.model_validate(analysis) for analysis in analyses],
@@ -411,11 +411,12 @@ async def _get_user_file(file_id: str, user_id: str, db: AsyncSession) -> FileRe
 
 
 async def _get_existing_analysis(file_id: str, db: AsyncSession) -> Optional[AnalysisResult]:
-    """Check if analysis already exists for this file."""
+    """Check if analysis already exists for this file (the most recent one if several)."""
     result = await db.execute(
         select(AnalysisResult)
         .where(AnalysisResult.file_id == file_id)
         .order_by(AnalysisResult.analysis_timestamp.desc())
+        .limit(1)
     )
     return result.scalar_one_or_none()
 
@@ -570,8 +571,6 @@ async def _format_analysis_response(analysis_record: AnalysisResult) -> Analysis
         rule_violations = analysis_record.rule_violations or {}
         
         # Create response components
-        from ...schemas.analysis import ForensicsResult, OCRResult, RuleEngineResult
-        
         forensics_result = ForensicsResult(
             edge_score=analysis_record.forensics_score or 0.0,
             compression_score=(analysis_record.compression_artifacts or {}).get('score', 0.0),
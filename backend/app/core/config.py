@@ -25,6 +25,8 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_LOCAL_CACHE_TTL: float = 5.0  # Seconds a read is served from process memory (0 disables)
+    REDIS_LOCAL_CACHE_SIZE: int = 1024  # Max keys held in the in-process cache
     
     # Celery Configuration
     CELERY_BROKER_URL: str = ""
@@ -65,6 +67,16 @@ class Settings(BaseSettings):
     CLAMAV_TIMEOUT: int = 30
     CLAMAV_ENABLED: bool = True
     
+    # PDF rendering backend: "pdfium" (in-process), "mupdf", or "pdf2image" (poppler).
+    # pypdfium2 is not thread-safe, so pdfium renders are serialized per process by a lock
+    # in pdf_utils; concurrent renders only run in parallel across processes.
+    PDF_RENDER_BACKEND: str = "pdfium"
+    
+    # Temp image directory: unset prefers /dev/shm when it has TEMP_IMAGE_TMPFS_MIN_FREE
+    # bytes free (Docker's default shm is only 64MB), else the system temp dir
+    TEMP_IMAGE_DIR: Optional[str] = None
+    TEMP_IMAGE_TMPFS_MIN_FREE: int = 256 * 1024 * 1024
+    
     # File Type Specific Limits
     MAX_IMAGE_SIZE: int = 50 * 1024 * 1024  # 50MB for images
     MAX_PDF_SIZE: int = 20 * 1024 * 1024    # 20MB for PDFs
@@ -438,10 +438,15 @@ class OCREngine:
             return validation_results
 
 
+# Engines are stateless between calls, so one per API key is reused rather than
+# re-running genai.configure and rebuilding the model client for every analysis
+_ocr_engines: Dict[str, OCREngine] = {}
+
+
 # Helper functions
 async def create_ocr_engine(api_key: Optional[str] = None) -> OCREngine:
     """
-    Create and initialize OCR engine.
+    Get the (cached) OCR engine for an API key, creating it on first use.
     
     Args:
         api_key: Optional API key, will use environment variable if not provided
@@ -455,7 +460,11 @@ async def create_ocr_engine(api_key: Optional[str] = None) -> OCREngine:
     if not api_key:
         raise OCRError("GEMINI_API_KEY environment variable not set")
     
-    return OCREngine(api_key)
+    engine = _ocr_engines.get(api_key)
+    if engine is None:
+        engine = _ocr_engines[api_key] = OCREngine(api_key)
+    
+    return engine
 
 
 async def extract_check_fields(image_path: str, api_key: Optional[str] = None) -> OCRResult:
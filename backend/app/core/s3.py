@@ -7,6 +7,12 @@ from typing import Optional
 import logging
 
 from .config import settings
+from ..utils.security_validation import (
+    read_upload_content,
+    validate_upload_security_async,
+    SecurityValidationError
+)
+from ..utils.malware_scanner import scan_file_for_malware, MalwareDetected, MalwareScanError
 
 logger = logging.getLogger(__name__)
 
@@ -208,17 +214,13 @@ class S3Service:
 
     async def validate_file(self, file: UploadFile) -> dict:
         """Validate file using basic security checks and ClamAV malware scanning."""
-        from ..utils.security_validation import validate_upload_security, SecurityValidationError
-        from ..utils.malware_scanner import scan_file_for_malware, MalwareDetected, MalwareScanError
-        
         try:
-            # Perform basic security validation (size, type, content structure)
-            validation_result = await validate_upload_security(file)
+            # Read the upload once; validation and ClamAV scanning share the bytes
+            file_content = read_upload_content(file)
             
-            # Read file content for ClamAV scanning
-            file.file.seek(0)
-            file_content = file.file.read()
-            file.file.seek(0)  # Reset for any subsequent reads
+            # Perform basic security validation (size, type, content structure);
+            # it is CPU-bound, so it runs in the shared process pool
+            validation_result = await validate_upload_security_async(file, file_content=file_content)
             
             # Perform ClamAV malware scanning directly
             try:
@@ -11,17 +11,51 @@ import os
 import logging
 import asyncio
 import aiofiles
+import aiohttp
 import tempfile
+import weakref
 from typing import Optional, Callable
 from pathlib import Path
 from dataclasses import dataclass
 
+from .s3 import s3_service
+from ..utils.image_utils import normalize_image_format, enhance_image_quality, cleanup_temp_files
+from ..utils.pdf_utils import convert_pdf_to_image_for_analysis
+
 logger = logging.getLogger(__name__)
 
 # Constants for streaming processing
 DEFAULT_CHUNK_SIZE = 8192  # 8KB chunks as specified in PRP
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB as specified in success criteria
 
+# Shared aiohttp sessions, one per event loop (sessions are bound to the loop that created them)
+_http_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session for the running event loop.
+    
+    Reusing one session keeps the connection pool (and keep-alive
+    connections to S3) alive across downloads.
+    
+    Returns:
+        aiohttp.ClientSession bound to the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    session = _http_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession()
+        _http_sessions[loop] = session
+    return session
+
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session for the running event loop, if any."""
+    session = _http_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
 
 @dataclass
 class StreamValidationResult:
@@ -250,9 +284,6 @@ async def stream_download_file(
         StreamingProcessingError: If download fails
     """
     try:
-        from ..core.s3 import s3_service
-        import aiohttp
-        
         # Generate presigned URL
         download_url = await s3_service.generate_presigned_url(s3_key)
         if not download_url:
@@ -268,36 +299,36 @@ async def stream_download_file(
         temp_file.close()
         
         # Stream download
-        async with aiohttp.ClientSession() as session:
-            async with session.get(download_url) as response:
-                if response.status != 200:
-                    raise StreamingProcessingError(
-                        f"Failed to download file from S3: HTTP {response.status}"
-                    )
-                
-                content_length = response.headers.get('Content-Length')
-                total_size = int(content_length) if content_length else 0
-                bytes_downloaded = 0
-                
-                async with aiofiles.open(temp_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
-                        await f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                        
-                        # Update progress
-                        if progress_callback and total_size > 0:
-                            progress = StreamProgress(
-                                phase="downloading",
-                                bytes_processed=bytes_downloaded,
-                                total_bytes=total_size,
-                                progress_percentage=(bytes_downloaded / total_size) * 100,
-                                chunks_processed=bytes_downloaded // DEFAULT_CHUNK_SIZE
-                            )
-                            progress_callback(progress)
-                        
-                        # Yield control periodically
-                        if bytes_downloaded % (DEFAULT_CHUNK_SIZE * 10) == 0:
-                            await asyncio.sleep(0.001)
+        session = get_http_session()
+        async with session.get(download_url) as response:
+            if response.status != 200:
+                raise StreamingProcessingError(
+                    f"Failed to download file from S3: HTTP {response.status}"
+                )
+            
+            content_length = response.headers.get('Content-Length')
+            total_size = int(content_length) if content_length else 0
+            bytes_downloaded = 0
+            
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
+                    await f.write(chunk)
+                    bytes_downloaded += len(chunk)
+                    
+                    # Update progress
+                    if progress_callback and total_size > 0:
+                        progress = StreamProgress(
+                            phase="downloading",
+                            bytes_processed=bytes_downloaded,
+                            total_bytes=total_size,
+                            progress_percentage=(bytes_downloaded / total_size) * 100,
+                            chunks_processed=bytes_downloaded // DEFAULT_CHUNK_SIZE
+                        )
+                        progress_callback(progress)
+                    
+                    # Yield control periodically
+                    if bytes_downloaded % (DEFAULT_CHUNK_SIZE * 10) == 0:
+                        await asyncio.sleep(0.001)
         
         return temp_path
         
@@ -369,9 +400,6 @@ async def _preprocess_image_streaming(
 ) -> str:
     """Preprocess image with streaming awareness."""
     try:
-        # Import existing utilities
-        from ..utils.image_utils import normalize_image_format, enhance_image_quality
-        
         if progress_callback:
             progress_callback(StreamProgress(
                 phase="preprocessing",
@@ -422,9 +450,6 @@ async def _preprocess_pdf_streaming(
 ) -> str:
     """Preprocess PDF with streaming awareness."""
     try:
-        # Import existing utilities
-        from ..utils.pdf_utils import convert_pdf_to_image_for_analysis
-        
         if progress_callback:
             progress_callback(StreamProgress(
                 phase="preprocessing",
@@ -465,8 +490,6 @@ async def cleanup_temp_files_background(file_paths: list[str]) -> None:
         file_paths: List of file paths to clean up
     """
     try:
-        from ..utils.image_utils import cleanup_temp_files
-        
         # Run cleanup in background
         def _cleanup():
             cleanup_temp_files(file_paths)
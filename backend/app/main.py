@@ -6,6 +6,7 @@ from app.core.config import settings
 from app.core.executor_manager import ExecutorManager
 from app.utils.redis_cache import RedisConnection
 from app.utils.cache import start_cache_cleanup_task
+from app.core.streaming import close_http_session
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifecycle: ProcessPoolExecutor and Redis connections."""
+    """Manage application lifecycle: ProcessPoolExecutor, Redis and HTTP connections."""
     # Startup
     try:
         # Initialize ProcessPoolExecutor
@@ -49,6 +50,10 @@ async def lifespan(app: FastAPI):
         await RedisConnection.close()
         logger.info("Redis connections closed successfully")
         
+        # Close the shared aiohttp session for this event loop
+        await close_http_session()
+        logger.info("HTTP session closed")
+        
     except Exception as e:
         logger.error(f"Error during application shutdown: {str(e)}")
 
@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import tempfile
-import aiohttp
 import aiofiles
 from pathlib import Path
 from typing import Optional
@@ -10,13 +9,14 @@ from contextlib import contextmanager
 
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker, Session
+from celery.signals import worker_process_shutdown
 
 from .celery_app import celery_app
 from ..core.config import settings
 from ..models.task_status import TaskStatus, TaskStatusEnum
 from ..models.file import FileRecord
 from ..models.analysis import AnalysisResult
-from ..core.streaming import StreamingFileProcessor, StreamProgress
+from ..core.streaming import StreamingFileProcessor, StreamProgress, get_http_session, close_http_session
 from .resource_monitor import (
     create_resource_monitor_for_file,
     ResourceLimitError,
@@ -48,6 +48,60 @@ engine = create_engine(settings.DATABASE_URL.replace("+asyncpg", ""))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Event loop kept for the lifetime of the worker process so loop-bound clients
+# (the shared aiohttp session) keep their connection pools between tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_in_worker_loop(coro):
+    """
+    Run a coroutine to completion on the worker process's persistent event loop.
+    
+    Like asyncio.run, any tasks still pending when the coroutine finishes (or
+    fails, e.g. on a soft time limit) are cancelled, so nothing leaks into the
+    next Celery task. Only loop-bound clients such as the HTTP session persist.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    try:
+        return _worker_loop.run_until_complete(coro)
+    finally:
+        _cancel_pending_tasks(_worker_loop)
+
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel all pending tasks on the loop and wait for them to finish cancelling."""
+    pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    for task in pending:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Pending task {task.get_name()} raised during cleanup: {task.exception()}")
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs):
+    """Close the shared HTTP session and event loop when the worker process exits."""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        try:
+            _worker_loop.run_until_complete(close_http_session())
+        finally:
+            _worker_loop.close()
+            _worker_loop = None
+
+
 @contextmanager
 def get_task_db_session():
     """Create a new database session for Celery tasks."""
@@ -121,17 +175,17 @@ async def download_file_sync(s3_key: str) -> str:
         temp_path = temp_file.name
         temp_file.close()
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(download_url) as response:
-                if response.status != 200:
-                    raise ValueError("Failed to download file from S3")
-                
-                # Save to temporary file
-                async with aiofiles.open(temp_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        await f.write(chunk)
-                
-                return temp_path
+        session = get_http_session()
+        async with session.get(download_url) as response:
+            if response.status != 200:
+                raise ValueError("Failed to download file from S3")
+            
+            # Save to temporary file
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(8192):
+                    await f.write(chunk)
+            
+            return temp_path
                 
     except Exception as e:
         logger.error(f"Failed to download file {s3_key}: {str(e)}")
@@ -403,7 +457,7 @@ def analyze_check_streaming(self, file_id: str, analysis_types: list, page_numbe
                     
                     return analysis_result
             
-            analysis_result = asyncio.run(process_with_streaming_and_analysis())
+            analysis_result = run_in_worker_loop(process_with_streaming_and_analysis())
             logger.info(f"Analysis completed for task {task_id}")
             
             # Log final resource usage
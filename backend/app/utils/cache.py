@@ -2,11 +2,20 @@
 Simple in-memory cache utility for dashboard data.
 """
 
-from typing import Any, Optional, Callable, TYPE_CHECKING
+from typing import Any, Optional, Callable, Tuple, TYPE_CHECKING
+from collections import OrderedDict
 import json
+import time
 import hashlib
 import logging
-from .redis_cache import RedisConnection, serialize_value, deserialize_value
+from ..core.config import settings
+from .redis_cache import (
+    RedisConnection,
+    serialize_value,
+    serialize_value_binary,
+    deserialize_value,
+    is_binary_payload
+)
 
 if TYPE_CHECKING:
     import redis.asyncio as redis
@@ -15,10 +24,48 @@ logger = logging.getLogger(__name__)
 
 
 class DistributedCache:
-    """Redis-backed distributed cache with TTL support."""
+    """
+    Redis-backed distributed cache with TTL support.
+    
+    Hot keys are also kept in a small in-process LRU for REDIS_LOCAL_CACHE_TTL
+    seconds so repeat reads skip the Redis round-trip. The LRU holds the same
+    serialized bytes as Redis and deserializes on every hit, so callers get the
+    same type whichever tier answers and never share a mutable instance.
+    Writes, deletes and clears made through this instance update it
+    immediately; changes made by other processes (including invalidations)
+    become visible there only once the local entry expires.
+    """
     
     def __init__(self):
         self._redis: Optional["redis.Redis"] = None
+        self._local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._local_ttl = settings.REDIS_LOCAL_CACHE_TTL
+        self._local_max_size = settings.REDIS_LOCAL_CACHE_SIZE
+    
+    def _local_get(self, key: str) -> Optional[bytes]:
+        """Get a serialized value from the in-process cache if present and fresh."""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        
+        self._local.move_to_end(key)
+        return value
+    
+    def _local_set(self, key: str, value: bytes, ttl_seconds: float):
+        """Store a serialized value in the in-process cache, evicting the least recently used key."""
+        ttl = min(self._local_ttl, ttl_seconds)
+        if ttl <= 0:
+            return
+        
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self._local_max_size:
+            self._local.popitem(last=False)
     
     async def _get_redis(self):
         """Get Redis client instance."""
@@ -37,11 +84,16 @@ class DistributedCache:
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from distributed cache."""
+        local_value = self._local_get(key)
+        if local_value is not None:
+            return deserialize_value(local_value)
+        
         try:
             redis_client = await self._get_redis()
             value = await redis_client.get(key)
             if value is None:
                 return None
+            self._local_set(key, value, self._local_ttl)
             return deserialize_value(value)
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
@@ -51,13 +103,18 @@ class DistributedCache:
         """Set value in distributed cache with TTL."""
         try:
             redis_client = await self._get_redis()
-            serialized_value = serialize_value(value)
+            if is_binary_payload(value):
+                serialized_value = serialize_value_binary(value)
+            else:
+                serialized_value = serialize_value(value)
             await redis_client.setex(key, ttl_seconds, serialized_value)
+            self._local_set(key, serialized_value, ttl_seconds)
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
     
     async def delete(self, key: str):
         """Delete key from distributed cache."""
+        self._local.pop(key, None)
         try:
             redis_client = await self._get_redis()
             await redis_client.delete(key)
@@ -66,6 +123,7 @@ class DistributedCache:
     
     async def clear(self):
         """Clear all cache entries."""
+        self._local.clear()
         try:
             redis_client = await self._get_redis()
             await redis_client.flushdb()
@@ -121,7 +179,12 @@ async def get_cache_instance() -> DistributedCache:
 
 
 async def invalidate_dashboard_cache(user_id: str):
-    """Invalidate all dashboard-related cache entries for a user."""
+    """
+    Invalidate all dashboard-related cache entries for a user.
+    
+    Clears Redis and this process's local tier. Other processes may keep serving
+    their local copy for up to REDIS_LOCAL_CACHE_TTL seconds.
+    """
     # In a more sophisticated implementation, we'd use pattern-based invalidation
     # For now, we'll clear the entire cache when data changes
     await _cache_instance.clear()
@@ -8,8 +8,7 @@ from .image_utils import (
     validate_image_file, 
     ImageValidationError, 
     ImageProcessingError,
-    normalize_image_format,
-    enhance_image_quality,
+    ProcessedImage,
     cleanup_temp_files
 )
 from .pdf_utils import (
@@ -168,22 +167,19 @@ def prepare_file_for_analysis(file_path: str, page_number: int = 1) -> str:
         if file_type == 'image':
             # Process as image
             try:
-                # Normalize image format
-                normalized_path = normalize_image_format(file_path, 'JPEG', quality=95)
+                # Normalize and enhance in memory so the image is decoded and encoded once
+                enhanced_path = Path(file_path).with_suffix('.normalized.enhanced.jpeg')
                 
-                # Enhance for analysis
-                enhanced_path = enhance_image_quality(
-                    normalized_path,
-                    enhance_contrast=True,
-                    enhance_sharpness=True,
-                    enhance_brightness=False
-                )
-                
-                # Clean up intermediate file if different
-                if normalized_path != enhanced_path and normalized_path != file_path:
-                    cleanup_temp_files([normalized_path])
-                
-                return enhanced_path
+                try:
+                    return ProcessedImage(file_path, validate=True).normalize('JPEG').enhance(
+                        enhance_contrast=True,
+                        enhance_sharpness=True,
+                        enhance_brightness=False
+                    ).save(enhanced_path, format='JPEG', quality=95, optimize=True)
+                except (ImageValidationError, ImageProcessingError):
+                    raise
+                except Exception as e:
+                    raise ImageProcessingError(f"Image enhancement failed: {str(e)}") from e
                 
             except (ImageValidationError, ImageProcessingError) as e:
                 raise FileProcessingError(f"Image processing failed: {str(e)}")
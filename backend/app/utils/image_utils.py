@@ -1,15 +1,28 @@
 import os
+import shutil
 import tempfile
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional, Union
 from pathlib import Path
 import cv2
 import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
 import io
 
+from ..core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# RAM-backed directory preferred for short-lived temp images
+TMPFS_DIR = '/dev/shm'
+
+# Estimated noise sigma (0-255 scale) below which an image is clean enough to skip denoising.
+# Clean scans and JPEG-compressed checks measure ~1.3-2.0; Gaussian noise of sigma 2 measures ~3.1.
+NOISE_SIGMA_THRESHOLD = 2.5
+
+# Immerkaer's noise estimation mask (difference of two Laplacians, cancels image structure)
+_NOISE_MASK = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+
 
 class ImageValidationError(Exception):
     """Exception raised for image validation errors."""
@@ -35,11 +48,13 @@ def validate_image_file(file_path: str) -> Dict[str, Any]:
         ImageValidationError: If validation fails
     """
     try:
-        if not os.path.exists(file_path):
+        # One stat call covers both the existence and the size check
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise ImageProcessingError(f"Image file not found: {file_path}")
         
         # Check file size
-        file_size = os.path.getsize(file_path)
         max_size = 50 * 1024 * 1024  # 50MB
         
         if file_size > max_size:
@@ -90,6 +105,179 @@ def validate_image_file(file_path: str) -> Dict[str, Any]:
             raise ImageValidationError(f"Image validation failed: {str(e)}")
 
 
+def _fit_dimensions(size: Tuple[int, int], max_width: int, max_height: int,
+                    maintain_aspect_ratio: bool = True) -> Tuple[int, int]:
+    """Compute the size that fits within max_width x max_height without upscaling."""
+    original_width, original_height = size
+    
+    if maintain_aspect_ratio:
+        # Calculate scaling factor
+        width_ratio = max_width / original_width
+        height_ratio = max_height / original_height
+        scale_factor = min(width_ratio, height_ratio, 1.0)  # Don't upscale
+        
+        return int(original_width * scale_factor), int(original_height * scale_factor)
+    
+    return min(max_width, original_width), min(max_height, original_height)
+
+
+def _flatten_onto_white(image: Image.Image) -> Image.Image:
+    """Composite an RGBA/LA image onto a white RGB background for JPEG output."""
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    # getchannel() copies only the alpha band; split() would copy every band
+    background.paste(image, mask=image.getchannel('A') if image.mode == 'RGBA' else None)
+    return background
+
+
+def estimate_noise_level(image: Image.Image) -> float:
+    """
+    Estimate the standard deviation of Gaussian noise in an image.
+    
+    Uses Immerkaer's fast noise variance estimation on the grayscale image:
+    the mean absolute response to _NOISE_MASK, scaled to a sigma. Unlike the
+    Laplacian variance, text and edges contribute little, so clean scans read low.
+    
+    Args:
+        image: PIL Image object
+        
+    Returns:
+        Estimated noise sigma on the 0-255 scale
+    """
+    if image.mode == 'L':
+        gray = np.asarray(image)
+    elif image.mode == 'RGB':
+        gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+    else:
+        gray = np.asarray(image.convert('L'))
+    
+    height, width = gray.shape
+    if height < 3 or width < 3:
+        return 0.0
+    
+    response = cv2.filter2D(gray, cv2.CV_16S, _NOISE_MASK)[1:-1, 1:-1]
+    total = cv2.norm(response, cv2.NORM_L1)
+    return float(total * np.sqrt(np.pi / 2) / (6 * (width - 2) * (height - 2)))
+
+
+class ProcessedImage:
+    """
+    Decoded image held in memory so several operations share a single decode.
+    
+    Each operation replaces the in-memory image and returns ``self``, so calls
+    can be chained and written out once, e.g.
+    ``ProcessedImage(path).resize(1024, 1024).enhance().save(out_path)``.
+    """
+    
+    def __init__(self, source: Union[str, Image.Image], validate: bool = False):
+        """
+        Args:
+            source: Path to an image file or an already decoded PIL Image
+            validate: Whether to run validate_image_file on a path source
+        """
+        self.file_path: Optional[str] = None
+        self.meta: Dict[str, Any] = {}
+        
+        if isinstance(source, Image.Image):
+            self.image = source
+        else:
+            self.file_path = source
+            if validate:
+                self.meta = validate_image_file(source)
+            self.image = Image.open(source)
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.image.size
+    
+    def normalize(self, target_format: str = 'JPEG') -> 'ProcessedImage':
+        """Convert the image mode so it can be saved as target_format."""
+        if target_format == 'JPEG' and self.image.mode in ('RGBA', 'LA'):
+            self.image = _flatten_onto_white(self.image)
+        elif target_format == 'JPEG' and self.image.mode != 'RGB':
+            self.image = self.image.convert('RGB')
+        return self
+    
+    def resize(self, max_width: int = 2048, max_height: int = 2048,
+               maintain_aspect_ratio: bool = True) -> 'ProcessedImage':
+        """Shrink the image to fit within max_width x max_height (never upscales)."""
+        new_size = _fit_dimensions(self.image.size, max_width, max_height, maintain_aspect_ratio)
+        
+        # Only resize if dimensions changed
+        if new_size != self.image.size:
+            self.image = self.image.resize(new_size, Image.Resampling.LANCZOS)
+        return self
+    
+    def enhance(self, enhance_contrast: bool = True, enhance_sharpness: bool = True,
+                enhance_brightness: bool = False, force_denoise: bool = False) -> 'ProcessedImage':
+        """
+        Apply the OCR-oriented contrast/sharpness/brightness enhancements.
+        
+        The median denoise pass only runs when the estimated noise sigma of the
+        input reaches NOISE_SIGMA_THRESHOLD, unless force_denoise is set.
+        """
+        # Measure noise before contrast/sharpness amplify it
+        needs_denoise = force_denoise or estimate_noise_level(self.image) >= NOISE_SIGMA_THRESHOLD
+        
+        if enhance_contrast:
+            enhancer = ImageEnhance.Contrast(self.image)
+            self.image = enhancer.enhance(1.2)  # Increase contrast by 20%
+        
+        if enhance_sharpness:
+            enhancer = ImageEnhance.Sharpness(self.image)
+            self.image = enhancer.enhance(1.1)  # Increase sharpness by 10%
+        
+        if enhance_brightness:
+            enhancer = ImageEnhance.Brightness(self.image)
+            self.image = enhancer.enhance(1.05)  # Increase brightness by 5%
+        
+        # Apply noise reduction only when the image is noisy enough to need it
+        if needs_denoise:
+            self.image = self.image.filter(ImageFilter.MedianFilter(size=3))
+        return self
+    
+    def grayscale(self) -> 'ProcessedImage':
+        """Convert the image to single-channel grayscale."""
+        if self.image.mode in ('RGB', 'L'):
+            # OpenCV's SIMD RGB->gray conversion is several times faster than PIL's convert('L')
+            arr = np.asarray(self.image)
+            if arr.ndim == 3:
+                arr = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+            self.image = Image.fromarray(arr, 'L')
+        else:
+            self.image = self.image.convert('L')
+        return self
+    
+    def crop(self, bbox: Tuple[int, int, int, int]) -> 'ProcessedImage':
+        """Crop the image to bbox given as (left, top, right, bottom)."""
+        # Validate bounding box
+        left, top, right, bottom = bbox
+        width, height = self.image.size
+        
+        if left < 0 or top < 0 or right > width or bottom > height:
+            raise ImageProcessingError(f"Bounding box {bbox} is outside image bounds {(width, height)}")
+        
+        if left >= right or top >= bottom:
+            raise ImageProcessingError(f"Invalid bounding box: {bbox}")
+        
+        self.image = self.image.crop(bbox)
+        return self
+    
+    def rotate(self, angle: float, expand: bool = True) -> 'ProcessedImage':
+        """Rotate the image counter-clockwise by angle degrees on a white fill."""
+        self.image = self.image.rotate(angle, expand=expand, fillcolor='white')
+        return self
+    
+    def thumbnail(self, size: Tuple[int, int] = (200, 200)) -> 'ProcessedImage':
+        """Shrink the image in place to fit within size."""
+        self.image.thumbnail(size, Image.Resampling.LANCZOS)
+        return self
+    
+    def save(self, output_path: Union[str, Path], format: Optional[str] = None, **save_kwargs) -> str:
+        """Encode the image to output_path and return the path as a string."""
+        self.image.save(output_path, format=format, **save_kwargs)
+        return str(output_path)
+
+
 def normalize_image_format(file_path: str, target_format: str = 'JPEG', 
                           quality: int = 90) -> str:
     """
@@ -107,20 +295,8 @@ def normalize_image_format(file_path: str, target_format: str = 'JPEG',
         ImageProcessingError: If processing fails
     """
     try:
-        # Validate input
-        validate_image_file(file_path)
-        
-        # Load image
-        image = Image.open(file_path)
-        
-        # Convert to RGB if necessary for JPEG
-        if target_format == 'JPEG' and image.mode in ('RGBA', 'LA'):
-            # Create white background for transparent images
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-            image = background
-        elif target_format == 'JPEG' and image.mode != 'RGB':
-            image = image.convert('RGB')
+        # Validate input and convert to RGB if necessary for JPEG
+        processed = ProcessedImage(file_path, validate=True).normalize(target_format)
         
         # Generate output path
         file_path_obj = Path(file_path)
@@ -134,9 +310,7 @@ def normalize_image_format(file_path: str, target_format: str = 'JPEG',
         elif target_format == 'PNG':
             save_kwargs['optimize'] = True
         
-        image.save(output_path, format=target_format, **save_kwargs)
-        
-        return str(output_path)
+        return processed.save(output_path, format=target_format, **save_kwargs)
         
     except Exception as e:
         raise ImageProcessingError(f"Image normalization failed: {str(e)}")
@@ -160,35 +334,28 @@ def resize_image(file_path: str, max_width: int = 2048, max_height: int = 2048,
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
-        image = Image.open(file_path)
-        original_width, original_height = image.size
-        
-        # Calculate new dimensions
-        if maintain_aspect_ratio:
-            # Calculate scaling factor
-            width_ratio = max_width / original_width
-            height_ratio = max_height / original_height
-            scale_factor = min(width_ratio, height_ratio, 1.0)  # Don't upscale
-            
-            new_width = int(original_width * scale_factor)
-            new_height = int(original_height * scale_factor)
-        else:
-            new_width = min(max_width, original_width)
-            new_height = min(max_height, original_height)
-        
-        # Only resize if dimensions changed
-        if new_width != original_width or new_height != original_height:
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Opening only reads the header, so the size check below costs no decode
+        processed = ProcessedImage(file_path)
         
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.resized{file_path_obj.suffix}')
         
-        # Save resized image
-        image.save(output_path, quality=90, optimize=True)
+        if _fit_dimensions(processed.size, max_width, max_height, maintain_aspect_ratio) == processed.size:
+            # Already within bounds: hard-link (or copy) the source instead of re-encoding it
+            try:
+                os.unlink(output_path)
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(file_path, output_path)
+            except OSError:
+                shutil.copyfile(file_path, output_path)
+            return str(output_path)
         
-        return str(output_path)
+        # Save resized image
+        processed.resize(max_width, max_height, maintain_aspect_ratio)
+        return processed.save(output_path, quality=90, optimize=True)
         
     except Exception as e:
         raise ImageProcessingError(f"Image resizing failed: {str(e)}")
@@ -196,7 +363,8 @@ def resize_image(file_path: str, max_width: int = 2048, max_height: int = 2048,
 
 def enhance_image_quality(file_path: str, enhance_contrast: bool = True,
                          enhance_sharpness: bool = True, 
-                         enhance_brightness: bool = False) -> str:
+                         enhance_brightness: bool = False,
+                         force_denoise: bool = False) -> str:
     """
     Enhance image quality for better OCR and analysis.
     
@@ -205,6 +373,7 @@ def enhance_image_quality(file_path: str, enhance_contrast: bool = True,
         enhance_contrast: Whether to enhance contrast
         enhance_sharpness: Whether to enhance sharpness
         enhance_brightness: Whether to enhance brightness
+        force_denoise: Always apply the median denoise pass, even on clean images
         
     Returns:
         Path to the enhanced image file
@@ -213,33 +382,19 @@ def enhance_image_quality(file_path: str, enhance_contrast: bool = True,
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
-        image = Image.open(file_path)
-        
-        # Apply enhancements
-        if enhance_contrast:
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(1.2)  # Increase contrast by 20%
-        
-        if enhance_sharpness:
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(1.1)  # Increase sharpness by 10%
-        
-        if enhance_brightness:
-            enhancer = ImageEnhance.Brightness(image)
-            image = enhancer.enhance(1.05)  # Increase brightness by 5%
-        
-        # Apply noise reduction
-        image = image.filter(ImageFilter.MedianFilter(size=3))
+        processed = ProcessedImage(file_path).enhance(
+            enhance_contrast=enhance_contrast,
+            enhance_sharpness=enhance_sharpness,
+            enhance_brightness=enhance_brightness,
+            force_denoise=force_denoise
+        )
         
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.enhanced{file_path_obj.suffix}')
         
         # Save enhanced image
-        image.save(output_path, quality=95, optimize=True)
-        
-        return str(output_path)
+        return processed.save(output_path, quality=95, optimize=True)
         
     except Exception as e:
         raise ImageProcessingError(f"Image enhancement failed: {str(e)}")
@@ -259,18 +414,24 @@ def convert_to_grayscale(file_path: str) -> str:
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
+        # Load image header only; pixel data is decoded by whichever path runs below
         image = Image.open(file_path)
         
-        # Convert to grayscale
-        grayscale_image = image.convert('L')
-        
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.grayscale{file_path_obj.suffix}')
         
-        # Save grayscale image
-        grayscale_image.save(output_path, quality=90, optimize=True)
+        if image.mode in ('RGB', 'L') and image.format in ('JPEG', 'PNG'):
+            # OpenCV's SIMD BGR->gray conversion is several times faster than PIL's convert('L')
+            gray = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE | cv2.IMREAD_IGNORE_ORIENTATION)
+            if gray is None:
+                raise ImageProcessingError(f"Could not load image: {file_path}")
+            
+            if not cv2.imwrite(str(output_path), gray, [cv2.IMWRITE_JPEG_QUALITY, 90]):
+                raise ImageProcessingError(f"Could not write image: {output_path}")
+        else:
+            # Alpha-carrying and palette images keep PIL's mode-aware conversion
+            ProcessedImage(image).grayscale().save(output_path, quality=90, optimize=True)
         
         return str(output_path)
         
@@ -293,30 +454,15 @@ def crop_image(file_path: str, bbox: Tuple[int, int, int, int]) -> str:
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
-        image = Image.open(file_path)
-        
-        # Validate bounding box
-        left, top, right, bottom = bbox
-        width, height = image.size
-        
-        if left < 0 or top < 0 or right > width or bottom > height:
-            raise ImageProcessingError(f"Bounding box {bbox} is outside image bounds {(width, height)}")
-        
-        if left >= right or top >= bottom:
-            raise ImageProcessingError(f"Invalid bounding box: {bbox}")
-        
-        # Crop image
-        cropped_image = image.crop(bbox)
+        # Crop image (bounding box is validated against the image size)
+        processed = ProcessedImage(file_path).crop(bbox)
         
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.cropped{file_path_obj.suffix}')
         
         # Save cropped image
-        cropped_image.save(output_path, quality=90, optimize=True)
-        
-        return str(output_path)
+        return processed.save(output_path, quality=90, optimize=True)
         
     except Exception as e:
         raise ImageProcessingError(f"Image cropping failed: {str(e)}")
@@ -338,20 +484,15 @@ def rotate_image(file_path: str, angle: float, expand: bool = True) -> str:
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
-        image = Image.open(file_path)
-        
         # Rotate image
-        rotated_image = image.rotate(angle, expand=expand, fillcolor='white')
+        processed = ProcessedImage(file_path).rotate(angle, expand=expand)
         
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.rotated{file_path_obj.suffix}')
         
         # Save rotated image
-        rotated_image.save(output_path, quality=90, optimize=True)
-        
-        return str(output_path)
+        return processed.save(output_path, quality=90, optimize=True)
         
     except Exception as e:
         raise ImageProcessingError(f"Image rotation failed: {str(e)}")
@@ -371,14 +512,11 @@ def detect_image_orientation(file_path: str) -> float:
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image with OpenCV
-        image = cv2.imread(file_path)
-        if image is None:
+        # Decode straight to grayscale; skips the BGR buffer and colour conversion
+        gray = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             raise ImageProcessingError(f"Could not load image: {file_path}")
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
         # Apply edge detection
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
         
@@ -434,20 +572,15 @@ def create_thumbnail(file_path: str, size: Tuple[int, int] = (200, 200)) -> str:
         ImageProcessingError: If processing fails
     """
     try:
-        # Load image
-        image = Image.open(file_path)
-        
         # Create thumbnail
-        image.thumbnail(size, Image.Resampling.LANCZOS)
+        processed = ProcessedImage(file_path).thumbnail(size)
         
         # Generate output path
         file_path_obj = Path(file_path)
         output_path = file_path_obj.with_suffix(f'.thumbnail{file_path_obj.suffix}')
         
         # Save thumbnail
-        image.save(output_path, quality=85, optimize=True)
-        
-        return str(output_path)
+        return processed.save(output_path, quality=85, optimize=True)
         
     except Exception as e:
         raise ImageProcessingError(f"Thumbnail creation failed: {str(e)}")
@@ -510,9 +643,11 @@ def cleanup_temp_files(file_paths: list):
     
     for file_path in file_paths:
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Cleaned up temporary file: {file_path}")
+            # Single unlink syscall; a missing file is not an error
+            os.unlink(file_path)
+            logger.debug(f"Cleaned up temporary file: {file_path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to clean up file {file_path}: {str(e)}")
 
@@ -559,9 +694,7 @@ def image_to_bytes(image: Image.Image, format: str = 'JPEG', quality: int = 90)
         
         # Convert to RGB if necessary for JPEG
         if format == 'JPEG' and image.mode in ('RGBA', 'LA'):
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-            image = background
+            image = _flatten_onto_white(image)
         
         # Save to stream
         save_kwargs = {}
@@ -577,17 +710,45 @@ def image_to_bytes(image: Image.Image, format: str = 'JPEG', quality: int = 90)
         raise ImageProcessingError(f"Failed to convert image to bytes: {str(e)}")
 
 
+def get_temp_image_dir() -> str:
+    """
+    Directory for temporary image files.
+    
+    Uses settings.TEMP_IMAGE_DIR when set. Otherwise prefers tmpfs (/dev/shm)
+    while it has at least TEMP_IMAGE_TMPFS_MIN_FREE bytes free, since a full
+    shm (64MB by default in Docker) fails writes with ENOSPC, and falls back to
+    the system temp directory.
+    
+    Returns:
+        Path of the directory to create temp images in
+    """
+    if settings.TEMP_IMAGE_DIR:
+        return settings.TEMP_IMAGE_DIR
+    
+    try:
+        st = os.statvfs(TMPFS_DIR)
+        if st.f_bavail * st.f_frsize >= settings.TEMP_IMAGE_TMPFS_MIN_FREE:
+            return TMPFS_DIR
+    except OSError:
+        pass
+    
+    return tempfile.gettempdir()
+
+
 # Context manager for temporary image files
 class TempImageFile:
-    """Context manager for temporary image files."""
+    """Context manager for temporary image files, created in get_temp_image_dir() by default."""
     
-    def __init__(self, suffix: str = '.jpg'):
+    def __init__(self, suffix: str = '.jpg', dir: Optional[str] = None):
         self.suffix = suffix
+        self.dir = dir
         self.temp_file = None
         self.file_path = None
     
     def __enter__(self):
-        self.temp_file = tempfile.NamedTemporaryFile(suffix=self.suffix, delete=False)
+        self.temp_file = tempfile.NamedTemporaryFile(
+            suffix=self.suffix, delete=False, dir=self.dir or get_temp_image_dir()
+        )
         self.file_path = self.temp_file.name
         return self.file_path
     
@@ -595,8 +756,10 @@ class TempImageFile:
         if self.temp_file:
             self.temp_file.close()
         
-        if self.file_path and os.path.exists(self.file_path):
+        if self.file_path:
             try:
-                os.remove(self.file_path)
+                os.unlink(self.file_path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to clean up temporary file {self.file_path}: {str(e)}")
\ No newline at end of file
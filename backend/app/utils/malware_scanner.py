@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, Any
 from io import BytesIO
@@ -31,6 +32,24 @@ class MalwareScanner:
             logger.info("Malware scanning is disabled")
 
     async def scan_file_content(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+        """
+        Scan file content for malware off the event loop; see scan_file_content_sync.
+        
+        Args:
+            file_content: Raw file content bytes
+            filename: Original filename for context
+            
+        Returns:
+            Dictionary with scan results
+            
+        Raises:
+            MalwareDetected: If malware is found
+            MalwareScanError: If scanning fails
+        """
+        # The clamd client does blocking socket I/O
+        return await asyncio.to_thread(self.scan_file_content_sync, file_content, filename)
+
+    def scan_file_content_sync(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
         Scan file content for malware using ClamAV daemon only.
         
@@ -50,7 +69,7 @@ class MalwareScanner:
         
         try:
             # Single ClamAV scan only, no fallbacks
-            result = await self._scan_with_clamd_socket(file_content, filename)
+            result = self._scan_with_clamd_socket(file_content, filename)
             if not result['clean']:
                 raise MalwareDetected(f"Malware detected: {result['threat_name']}")
             return result
@@ -61,7 +80,7 @@ class MalwareScanner:
             # No fallback - fail immediately
             raise MalwareScanError(f"ClamAV scan failed: {str(e)}")
 
-    async def _scan_with_clamd_socket(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _scan_with_clamd_socket(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """Scan file using ClamAV daemon via Unix socket."""
         try:
             import clamd
@@ -124,4 +143,4 @@ async def scan_file_for_malware(file_content: bytes, filename: str) -> Dict[str,
         MalwareDetected: If malware is found
         MalwareScanError: If scanning fails
     """
-    return await malware_scanner.scan_file_content(file_content, filename)
\ No newline at end of file
+    return await malware_scanner.scan_file_content(file_content, filename)
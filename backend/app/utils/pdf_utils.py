@@ -1,19 +1,45 @@
 import os
+import contextlib
+import copy
+import functools
 import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import PyPDF2
 import fitz  # PyMuPDF
+import pypdfium2 as pdfium
 from pdf2image import convert_from_path
 from PIL import Image
-import io
 
+from ..core.config import settings
+from ..core.executor_manager import get_forensics_executor
 from .image_utils import (
+    ProcessedImage,
     cleanup_temp_files
 )
 
 logger = logging.getLogger(__name__)
 
+# File signature required by the PDF spec
+PDF_SIGNATURE = b'%PDF-'
+
+# Long-edge pixel budget for analysis renders; OCR gains nothing from more, and
+# capping it keeps a 300 DPI letter page from becoming an 8 MP image
+ANALYSIS_TARGET_LONG_EDGE_PX = 1800
+
+# pdftoppm worker threads; leave one core for the request/event loop
+PDF_RENDER_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
+# pypdfium2 is not thread-safe: every PDFium call in this process goes through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# Runs the PyPDF2 metadata pass alongside the PyMuPDF one in extract_pdf_metadata
+_METADATA_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pdf-metadata')
+
 
 class PDFValidationError(Exception):
     """Exception raised for PDF validation errors."""
@@ -25,12 +51,132 @@ class PDFProcessingError(Exception):
     pass
 
 
-def validate_pdf_file(file_path: str) -> Dict[str, Any]:
+class PdfSession:
+    """
+    Context manager holding one opened PDF for a multi-step pipeline.
+    
+    Steps that accept a session reuse its PyMuPDF document and PyPDF2 reader instead
+    of re-opening (and re-parsing the xref of) the file. Both handles are opened
+    lazily on first use and closed on exit. A session is not thread-safe beyond
+    one thread per handle.
+    """
+    
+    def __init__(self, file_path: str):
+        self.path = file_path
+        self._doc = None
+        self._file = None
+        self._pypdf = None
+    
+    @property
+    def doc(self) -> "fitz.Document":
+        """The shared PyMuPDF document."""
+        if self._doc is None:
+            self._doc = fitz.open(self.path)
+        return self._doc
+    
+    @property
+    def pypdf(self) -> PyPDF2.PdfReader:
+        """The shared PyPDF2 reader (keeps the underlying file open)."""
+        if self._pypdf is None:
+            file = open(self.path, 'rb')
+            try:
+                self._pypdf = PyPDF2.PdfReader(file)
+            except Exception:
+                file.close()
+                raise
+            self._file = file
+        return self._pypdf
+    
+    def close(self):
+        """Close any handles opened by this session."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._pypdf = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+@contextlib.contextmanager
+def _mupdf_document(file_path: str, session: Optional[PdfSession] = None):
+    """Yield the session's document, or a freshly opened one that is closed afterwards."""
+    if session is not None:
+        yield session.doc
+    else:
+        with fitz.open(file_path) as doc:
+            yield doc
+
+
+def _ensure_pdf_document(doc: "fitz.Document") -> None:
+    """Reject documents MuPDF opened from a non-PDF format (e.g. a renamed image)."""
+    if not doc.is_pdf:
+        raise PDFValidationError("Invalid PDF file: not a PDF document")
+
+
+@contextlib.contextmanager
+def _pypdf2_reader(file_path: str, session: Optional[PdfSession] = None):
+    """Yield the session's PyPDF2 reader, or one over a freshly opened file."""
+    if session is not None:
+        yield session.pypdf
+    else:
+        with open(file_path, 'rb') as file:
+            yield PyPDF2.PdfReader(file)
+
+
+def _cache_per_file_version(maxsize: int = 256):
+    """
+    In-process LRU for pure functions of a PDF file, keyed on (path, mtime, size).
+    
+    Results are deep-copied on the way out so callers can mutate them freely.
+    """
+    def decorator(func):
+        # An OrderedDict rather than lru_cache so the session stays out of the key
+        entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(file_path: str, session: Optional[PdfSession] = None):
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                # Nothing to key on; let the function report the missing file itself
+                return func(file_path, session=session)
+            
+            key = (file_path, st.st_mtime_ns, st.st_size)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    return copy.deepcopy(entries[key])
+            
+            result = func(file_path, session=session)
+            
+            with lock:
+                entries[key] = result
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            
+            return copy.deepcopy(result)
+        
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+def validate_pdf_file(file_path: str, session: Optional[PdfSession] = None) -> Dict[str, Any]:
     """
     Validate PDF file format, size, and properties.
     
     Args:
         file_path: Path to the PDF file
+        session: Optional open PdfSession to validate against instead of re-opening the file
         
     Returns:
         Dictionary with validation results
@@ -38,69 +184,82 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
     Raises:
         PDFValidationError: If validation fails
     """
+    outcome = _validate_pdf_outcome(file_path, session=session)
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+@_cache_per_file_version()
+def _validate_pdf_outcome(file_path: str, session: Optional[PdfSession] = None):
+    """
+    Run _validate_pdf, returning rather than raising validation failures.
+    
+    Returning the exception lets the per-file-version cache remember failures too.
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return PDFProcessingError(f"PDF file not found: {file_path}")
+    
+    try:
+        return _validate_pdf(file_path, st.st_size, session)
+    except (PDFValidationError, PDFProcessingError) as e:
+        # Drop the traceback so the cache does not pin the failing frames
+        return e.with_traceback(None)
+
+
+def _validate_pdf(file_path: str, file_size: int, session: Optional[PdfSession] = None) -> Dict[str, Any]:
+    """Run the PDF validation checks; see validate_pdf_file."""
     try:
-        if not os.path.exists(file_path):
-            raise PDFProcessingError(f"PDF file not found: {file_path}")
-        
         # Check file size
-        file_size = os.path.getsize(file_path)
         max_size = 50 * 1024 * 1024  # 50MB
         
         if file_size > max_size:
             raise PDFValidationError(f"PDF file too large: {file_size} bytes (max: {max_size} bytes)")
         
-        # Try to open with PyPDF2 for basic validation
+        # A single PyMuPDF open provides page count, encryption and metadata;
+        # PyPDF2 is only used if MuPDF cannot open the file
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-                
-                # Check page count
-                max_pages = 10  # Reasonable limit for check images
-                if num_pages > max_pages:
-                    raise PDFValidationError(f"PDF has too many pages: {num_pages} (max: {max_pages})")
-                
-                # Check if PDF is encrypted
-                if pdf_reader.is_encrypted:
-                    raise PDFValidationError("Encrypted PDFs are not supported")
-                
-                # Get metadata
-                metadata = pdf_reader.metadata or {}
-                
-        except PyPDF2.errors.PdfReadError as e:
-            raise PDFValidationError(f"Invalid PDF file: {str(e)}")
-        
-        # Additional validation with PyMuPDF for more detailed info
-        try:
-            doc = fitz.open(file_path)
+            with _mupdf_document(file_path, session) as doc:
+                _ensure_pdf_document(doc)
+                num_pages = doc.page_count
+                doc_metadata = doc.metadata or {}
+                is_encrypted = bool(doc.needs_pass or doc.is_encrypted or doc_metadata.get('encryption'))
             
-            # Check if document is valid
-            if doc.is_closed:
-                raise PDFValidationError("PDF document appears to be corrupted")
-            
-            # Get additional metadata
-            doc_metadata = doc.metadata
-            doc.close()
+            metadata = {
+                'title': doc_metadata.get('title', ''),
+                'author': doc_metadata.get('author', ''),
+                'subject': doc_metadata.get('subject', ''),
+                'creator': doc_metadata.get('creator', ''),
+                'producer': doc_metadata.get('producer', ''),
+                'creation_date': doc_metadata.get('creationDate', ''),
+                'modification_date': doc_metadata.get('modDate', '')
+            }
             
+        except PDFValidationError:
+            raise
         except Exception as e:
-            logger.warning(f"PyMuPDF validation failed: {str(e)}")
+            logger.warning(f"PyMuPDF validation failed, falling back to PyPDF2: {str(e)}")
+            num_pages, is_encrypted, metadata = _read_pdf_basics_pypdf2(file_path, session)
             doc_metadata = {}
         
+        # Check page count
+        max_pages = 10  # Reasonable limit for check images
+        if num_pages > max_pages:
+            raise PDFValidationError(f"PDF has too many pages: {num_pages} (max: {max_pages})")
+        
+        # Check if PDF is encrypted
+        if is_encrypted:
+            raise PDFValidationError("Encrypted PDFs are not supported")
+        
         return {
             'valid': True,
             'format': 'PDF',
             'file_size': file_size,
             'page_count': num_pages,
             'is_encrypted': False,
-            'metadata': {
-                'title': metadata.get('/Title', ''),
-                'author': metadata.get('/Author', ''),
-                'subject': metadata.get('/Subject', ''),
-                'creator': metadata.get('/Creator', ''),
-                'producer': metadata.get('/Producer', ''),
-                'creation_date': str(metadata.get('/CreationDate', '')),
-                'modification_date': str(metadata.get('/ModDate', ''))
-            },
+            'metadata': metadata,
             'mupdf_metadata': doc_metadata
         }
         
@@ -112,49 +271,54 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
         raise PDFValidationError(f"PDF validation failed: {str(e)}")
 
 
-def extract_pdf_metadata(file_path: str) -> Dict[str, Any]:
-    """
-    Extract comprehensive metadata from PDF file.
-    
-    Args:
-        file_path: Path to the PDF file
-        
-    Returns:
-        Dictionary with metadata information
-        
-    Raises:
-        PDFProcessingError: If processing fails
-    """
+def _read_pdf_basics_pypdf2(file_path: str, session: Optional[PdfSession] = None):
+    """Fallback page count, encryption flag and metadata via PyPDF2."""
     try:
-        metadata = {}
-        
-        # Extract metadata with PyPDF2
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                pdf_metadata = pdf_reader.metadata or {}
-                
-                metadata['basic'] = {
-                    'page_count': len(pdf_reader.pages),
-                    'is_encrypted': pdf_reader.is_encrypted,
-                    'title': pdf_metadata.get('/Title', ''),
-                    'author': pdf_metadata.get('/Author', ''),
-                    'subject': pdf_metadata.get('/Subject', ''),
-                    'creator': pdf_metadata.get('/Creator', ''),
-                    'producer': pdf_metadata.get('/Producer', ''),
-                    'creation_date': str(pdf_metadata.get('/CreationDate', '')),
-                    'modification_date': str(pdf_metadata.get('/ModDate', ''))
-                }
-                
-        except Exception as e:
-            logger.warning(f"PyPDF2 metadata extraction failed: {str(e)}")
-            metadata['basic'] = {}
-        
-        # Extract detailed metadata with PyMuPDF
-        try:
-            doc = fitz.open(file_path)
+        with _pypdf2_reader(file_path, session) as pdf_reader:
+            metadata = pdf_reader.metadata or {}
             
-            metadata['detailed'] = {
+            return len(pdf_reader.pages), pdf_reader.is_encrypted, {
+                'title': metadata.get('/Title', ''),
+                'author': metadata.get('/Author', ''),
+                'subject': metadata.get('/Subject', ''),
+                'creator': metadata.get('/Creator', ''),
+                'producer': metadata.get('/Producer', ''),
+                'creation_date': str(metadata.get('/CreationDate', '')),
+                'modification_date': str(metadata.get('/ModDate', ''))
+            }
+            
+    except PyPDF2.errors.PdfReadError as e:
+        raise PDFValidationError(f"Invalid PDF file: {str(e)}")
+
+
+def _pypdf2_meta(file_path: str, session: Optional[PdfSession] = None) -> Dict[str, Any]:
+    """Basic document metadata via PyPDF2 (empty dict on failure)."""
+    try:
+        with _pypdf2_reader(file_path, session) as pdf_reader:
+            pdf_metadata = pdf_reader.metadata or {}
+            
+            return {
+                'page_count': len(pdf_reader.pages),
+                'is_encrypted': pdf_reader.is_encrypted,
+                'title': pdf_metadata.get('/Title', ''),
+                'author': pdf_metadata.get('/Author', ''),
+                'subject': pdf_metadata.get('/Subject', ''),
+                'creator': pdf_metadata.get('/Creator', ''),
+                'producer': pdf_metadata.get('/Producer', ''),
+                'creation_date': str(pdf_metadata.get('/CreationDate', '')),
+                'modification_date': str(pdf_metadata.get('/ModDate', ''))
+            }
+            
+    except Exception as e:
+        logger.warning(f"PyPDF2 metadata extraction failed: {str(e)}")
+        return {}
+
+
+def _pymupdf_meta(file_path: str, session: Optional[PdfSession] = None) -> Dict[str, Any]:
+    """Detailed document metadata via PyMuPDF (empty dict on failure)."""
+    try:
+        with _mupdf_document(file_path, session) as doc:
+            detailed = {
                 'page_count': doc.page_count,
                 'is_pdf': doc.is_pdf,
                 'needs_pass': doc.needs_pass,
@@ -169,20 +333,46 @@ def extract_pdf_metadata(file_path: str) -> Dict[str, Any]:
             for page_num in range(min(doc.page_count, 5)):  # Limit to first 5 pages
                 page = doc[page_num]
                 rect = page.rect
-                metadata['detailed']['page_sizes'].append({
+                detailed['page_sizes'].append({
                     'page': page_num + 1,
                     'width': rect.width,
                     'height': rect.height,
                     'rotation': page.rotation
                 })
             
-            doc.close()
+            return detailed
             
-        except Exception as e:
-            logger.warning(f"PyMuPDF metadata extraction failed: {str(e)}")
-            metadata['detailed'] = {}
+    except Exception as e:
+        logger.warning(f"PyMuPDF metadata extraction failed: {str(e)}")
+        return {}
+
+
+@_cache_per_file_version()
+def extract_pdf_metadata(file_path: str, session: Optional[PdfSession] = None) -> Dict[str, Any]:
+    """
+    Extract comprehensive metadata from PDF file.
+    
+    The PyPDF2 and PyMuPDF passes share no state, so the PyPDF2 pass runs on a
+    worker thread while PyMuPDF (which releases the GIL while parsing) runs here.
+    
+    Args:
+        file_path: Path to the PDF file
+        session: Optional open PdfSession whose handles both passes reuse
         
-        return metadata
+    Returns:
+        Dictionary with metadata information
+        
+    Raises:
+        PDFProcessingError: If processing fails
+    """
+    try:
+        basic_future = _METADATA_EXECUTOR.submit(_pypdf2_meta, file_path, session)
+        detailed = _pymupdf_meta(file_path, session)
+        
+        return {
+            'basic': basic_future.result(),
+            'detailed': detailed
+        }
         
     except Exception as e:
         raise PDFProcessingError(f"Failed to extract PDF metadata: {str(e)}")
@@ -193,9 +383,59 @@ def convert_pdf_to_images(file_path: str,
                          output_format: str = 'JPEG',
                          quality: int = 90,
                          first_page: Optional[int] = None,
-                         last_page: Optional[int] = None) -> List[str]:
+                         last_page: Optional[int] = None,
+                         use_pool: bool = True) -> List[str]:
+    """
+    Convert PDF pages to images with the backend selected by PDF_RENDER_BACKEND.
+    
+    'pdfium' (default) renders in-process with pypdfium2; 'mupdf' and 'pdf2image'
+    (poppler's pdftoppm) are kept as fallbacks.
+    
+    Args:
+        file_path: Path to the PDF file
+        dpi: Resolution in DPI for conversion
+        output_format: Output image format ('JPEG', 'PNG')
+        quality: JPEG quality (1-100)
+        first_page: First page to convert (1-indexed)
+        last_page: Last page to convert (1-indexed)
+        use_pool: Let the 'mupdf' backend render pages on the shared process pool;
+            pass False when already running inside a pool worker
+        
+    Returns:
+        List of paths to converted image files
+        
+    Raises:
+        PDFProcessingError: If conversion fails
     """
-    Convert PDF pages to images.
+    backend = settings.PDF_RENDER_BACKEND.lower()
+    
+    if backend == 'pdfium':
+        convert = convert_pdf_to_images_pdfium
+    elif backend == 'mupdf':
+        convert = functools.partial(convert_pdf_to_images_mupdf, use_pool=use_pool)
+    elif backend == 'pdf2image':
+        convert = convert_pdf_to_images_pdf2image
+    else:
+        raise PDFProcessingError(f"Unknown PDF render backend: {settings.PDF_RENDER_BACKEND}")
+    
+    return convert(
+        file_path,
+        dpi=dpi,
+        output_format=output_format,
+        quality=quality,
+        first_page=first_page,
+        last_page=last_page
+    )
+
+
+def convert_pdf_to_images_pdfium(file_path: str,
+                                 dpi: int = 300,
+                                 output_format: str = 'JPEG',
+                                 quality: int = 90,
+                                 first_page: Optional[int] = None,
+                                 last_page: Optional[int] = None) -> List[str]:
+    """
+    Convert PDF pages to images in-process using PDFium (pypdfium2).
     
     Args:
         file_path: Path to the PDF file
@@ -213,38 +453,144 @@ def convert_pdf_to_images(file_path: str,
     """
     try:
         # Validate PDF first
-        validate_pdf_file(file_path)
+        page_count = validate_pdf_file(file_path)['page_count']
         
-        # Convert PDF to images
-        images = convert_from_path(
-            file_path,
-            dpi=dpi,
-            first_page=first_page,
-            last_page=last_page,
-            fmt=output_format.lower()
-        )
+        # Determine page range
+        start_page = max(1, first_page or 1)
+        end_page = min(page_count, last_page or page_count)
+        
+        if start_page > end_page:
+            raise PDFProcessingError(f"Invalid page range: {start_page} to {end_page}")
         
-        if not images:
-            raise PDFProcessingError("No pages could be converted from PDF")
+        # Save options
+        save_kwargs = {}
+        if output_format.upper() == 'JPEG':
+            save_kwargs['quality'] = quality
+            save_kwargs['optimize'] = True
+        elif output_format.upper() == 'PNG':
+            save_kwargs['optimize'] = True
         
-        # Save images to temporary files
         output_paths = []
         file_path_obj = Path(file_path)
         
-        for i, image in enumerate(images):
-            page_num = (first_page or 1) + i
-            output_path = file_path_obj.with_suffix(f'.page{page_num}.{output_format.lower()}')
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page_num in range(start_page, end_page + 1):
+                # Hold the lock only while PDFium renders; encoding and saving run unlocked
+                with _PDFIUM_LOCK:
+                    page = pdf[page_num - 1]
+                    try:
+                        image = page.render(scale=dpi / 72).to_pil()
+                    finally:
+                        page.close()
+                
+                # Convert to RGB if needed for JPEG
+                if output_format.upper() == 'JPEG' and image.mode != 'RGB':
+                    image = image.convert('RGB')
+                
+                output_path = file_path_obj.with_suffix(f'.page{page_num}.{output_format.lower()}')
+                image.save(output_path, format=output_format, **save_kwargs)
+                output_paths.append(str(output_path))
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
+        
+        return output_paths
+        
+    except Exception as e:
+        raise PDFProcessingError(f"PDF to image conversion (PDFium) failed: {str(e)}")
+
+
+def convert_pdf_to_images_pdf2image(file_path: str, 
+                                   dpi: int = 300,
+                                   output_format: str = 'JPEG',
+                                   quality: int = 90,
+                                   first_page: Optional[int] = None,
+                                   last_page: Optional[int] = None) -> List[str]:
+    """
+    Convert PDF pages to images using pdf2image (poppler's pdftoppm).
+    
+    Args:
+        file_path: Path to the PDF file
+        dpi: Resolution in DPI for conversion
+        output_format: Output image format ('JPEG', 'PNG')
+        quality: JPEG quality (1-100)
+        first_page: First page to convert (1-indexed)
+        last_page: Last page to convert (1-indexed)
+        
+    Returns:
+        List of paths to converted image files
+        
+    Raises:
+        PDFProcessingError: If conversion fails
+    """
+    try:
+        # Validate PDF first
+        validate_pdf_file(file_path)
+        
+        file_path_obj = Path(file_path)
+        
+        # JPEG fast path: pdftoppm encodes the final files itself, so nothing is
+        # decoded or re-encoded in Python. The scratch folder sits next to the PDF
+        # so moving each page into place is a rename rather than a copy.
+        if output_format.upper() == 'JPEG':
+            with tempfile.TemporaryDirectory(dir=file_path_obj.parent) as output_folder:
+                rendered_paths = convert_from_path(
+                    file_path,
+                    dpi=dpi,
+                    first_page=first_page,
+                    last_page=last_page,
+                    fmt='jpeg',
+                    jpegopt={'quality': quality, 'optimize': True},
+                    thread_count=PDF_RENDER_THREADS,
+                    output_folder=output_folder,
+                    paths_only=True
+                )
+                
+                if not rendered_paths:
+                    raise PDFProcessingError("No pages could be converted from PDF")
+                
+                output_paths = []
+                for i, rendered_path in enumerate(rendered_paths):
+                    page_num = (first_page or 1) + i
+                    output_path = str(file_path_obj.with_suffix(f'.page{page_num}.jpeg'))
+                    os.replace(rendered_path, output_path)
+                    output_paths.append(output_path)
             
-            # Save image
-            save_kwargs = {}
-            if output_format.upper() == 'JPEG':
-                save_kwargs['quality'] = quality
-                save_kwargs['optimize'] = True
-            elif output_format.upper() == 'PNG':
-                save_kwargs['optimize'] = True
+            return output_paths
+        
+        # pdftoppm only renders pages in parallel when writing to an output folder;
+        # pages are then lazily loaded from disk instead of held in memory
+        with tempfile.TemporaryDirectory() as output_folder:
+            images = convert_from_path(
+                file_path,
+                dpi=dpi,
+                first_page=first_page,
+                last_page=last_page,
+                fmt=output_format.lower(),
+                thread_count=PDF_RENDER_THREADS,
+                output_folder=output_folder
+            )
+            
+            if not images:
+                raise PDFProcessingError("No pages could be converted from PDF")
+            
+            # Save images to temporary files
+            output_paths = []
             
-            image.save(output_path, format=output_format, **save_kwargs)
-            output_paths.append(str(output_path))
+            for i, image in enumerate(images):
+                page_num = (first_page or 1) + i
+                output_path = file_path_obj.with_suffix(f'.page{page_num}.{output_format.lower()}')
+                
+                # Save image
+                save_kwargs = {}
+                if output_format.upper() == 'PNG':
+                    save_kwargs['optimize'] = True
+                
+                image.save(output_path, format=output_format, **save_kwargs)
+                image.close()
+                output_paths.append(str(output_path))
         
         return output_paths
         
@@ -252,12 +598,120 @@ def convert_pdf_to_images(file_path: str,
         raise PDFProcessingError(f"PDF to image conversion failed: {str(e)}")
 
 
+def _fit_dpi(page_width_pt: float, page_height_pt: float, dpi: int,
+             max_long_edge_px: Optional[int]) -> int:
+    """Lower dpi so the page's long edge renders to at most max_long_edge_px pixels."""
+    if not max_long_edge_px:
+        return dpi
+    
+    long_edge_pt = max(page_width_pt, page_height_pt)
+    if long_edge_pt <= 0:
+        return dpi
+    
+    return max(1, min(dpi, int(72 * max_long_edge_px / long_edge_pt)))
+
+
+def _render_page_image_mupdf(file_path: str, page_num: int, dpi: int,
+                             max_long_edge_px: Optional[int] = None) -> Image.Image:
+    """Render a single page (0-indexed) straight to an in-memory PIL image."""
+    with fitz.open(file_path) as doc:
+        page = doc[page_num]
+        dpi = _fit_dpi(page.rect.width, page.rect.height, dpi, max_long_edge_px)
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi / 72, dpi / 72), alpha=False)
+    
+    if pix.n >= 4:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    
+    mode = 'RGB' if pix.n == 3 else 'L'
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+
+def _render_page_image_pdfium(file_path: str, page_num: int, dpi: int,
+                              max_long_edge_px: Optional[int] = None) -> Image.Image:
+    """Render a single page (0-indexed) to an in-memory PIL image with PDFium."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            page = pdf[page_num]
+            try:
+                width_pt, height_pt = page.get_size()
+                dpi = _fit_dpi(width_pt, height_pt, dpi, max_long_edge_px)
+                return page.render(scale=dpi / 72).to_pil()
+            finally:
+                page.close()
+        finally:
+            pdf.close()
+
+
+def _render_page_image_pdf2image(file_path: str, page_num: int, dpi: int,
+                                 max_long_edge_px: Optional[int] = None) -> Image.Image:
+    """Render a single page (0-indexed) to an in-memory PIL image with poppler."""
+    if max_long_edge_px:
+        with fitz.open(file_path) as doc:
+            rect = doc[page_num].rect
+            dpi = _fit_dpi(rect.width, rect.height, dpi, max_long_edge_px)
+    
+    images = convert_from_path(file_path, dpi=dpi, first_page=page_num + 1, last_page=page_num + 1)
+    if not images:
+        raise PDFProcessingError(f"Failed to render PDF page {page_num + 1}")
+    return images[0]
+
+
+def _render_page_image(file_path: str, page_num: int, dpi: int,
+                       max_long_edge_px: Optional[int] = None) -> Image.Image:
+    """Render a single page (0-indexed) in memory with the PDF_RENDER_BACKEND renderer."""
+    backend = settings.PDF_RENDER_BACKEND.lower()
+    
+    if backend == 'pdfium':
+        render = _render_page_image_pdfium
+    elif backend == 'mupdf':
+        render = _render_page_image_mupdf
+    elif backend == 'pdf2image':
+        render = _render_page_image_pdf2image
+    else:
+        raise PDFProcessingError(f"Unknown PDF render backend: {settings.PDF_RENDER_BACKEND}")
+    
+    return render(file_path, page_num, dpi, max_long_edge_px)
+
+
+def _render_page_mupdf(file_path: str, page_num: int, dpi: int,
+                       output_format: str, quality: int, output_path: str,
+                       session: Optional[PdfSession] = None) -> str:
+    """Render a single page (0-indexed) to output_path; runs in a worker process unless given a session."""
+    with _mupdf_document(file_path, session) as doc:
+        page = doc[page_num]
+        
+        # Create matrix for scaling (DPI)
+        mat = fitz.Matrix(dpi / 72, dpi / 72)
+        
+        # Render page to pixmap
+        pix = page.get_pixmap(matrix=mat, alpha=False)
+    
+    # Drop to RGB for CMYK/other 4+ channel output so every encoder below accepts it
+    if pix.n >= 4:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    
+    # Encode straight from the pixmap; no PNG encode/decode round-trip through PIL
+    if output_format.upper() == 'JPEG':
+        Path(output_path).write_bytes(pix.tobytes("jpg", jpg_quality=quality))
+    elif output_format.upper() == 'PNG':
+        pix.save(output_path)
+    else:
+        mode = 'RGB' if pix.n == 3 else 'L'
+        image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+        image.save(output_path, format=output_format)
+    
+    return output_path
+
+
 def convert_pdf_to_images_mupdf(file_path: str,
                                dpi: int = 300,
                                output_format: str = 'JPEG',
                                quality: int = 90,
                                first_page: Optional[int] = None,
-                               last_page: Optional[int] = None) -> List[str]:
+                               last_page: Optional[int] = None,
+                               session: Optional[PdfSession] = None,
+                               use_pool: bool = True) -> List[str]:
     """
     Convert PDF pages to images using PyMuPDF (alternative method).
     
@@ -268,6 +722,9 @@ def convert_pdf_to_images_mupdf(file_path: str,
         quality: JPEG quality (1-100)
         first_page: First page to convert (0-indexed for PyMuPDF)
         last_page: Last page to convert (0-indexed for PyMuPDF)
+        session: Optional open PdfSession used for validation and single-page renders
+        use_pool: Render multiple pages in parallel on the shared process pool; pass
+            False when already running inside a pool worker
         
     Returns:
         List of paths to converted image files
@@ -277,72 +734,57 @@ def convert_pdf_to_images_mupdf(file_path: str,
     """
     try:
         # Validate PDF first
-        validate_pdf_file(file_path)
-        
-        # Open PDF with PyMuPDF
-        doc = fitz.open(file_path)
+        page_count = validate_pdf_file(file_path, session=session)['page_count']
         
         # Determine page range
         start_page = (first_page - 1) if first_page else 0
-        end_page = (last_page - 1) if last_page else doc.page_count - 1
+        end_page = (last_page - 1) if last_page else page_count - 1
         
         # Ensure valid range
         start_page = max(0, start_page)
-        end_page = min(doc.page_count - 1, end_page)
+        end_page = min(page_count - 1, end_page)
         
         if start_page > end_page:
             raise PDFProcessingError(f"Invalid page range: {start_page+1} to {end_page+1}")
         
-        output_paths = []
         file_path_obj = Path(file_path)
+        jobs = [
+            (page_num, str(file_path_obj.with_suffix(f'.page{page_num+1}.{output_format.lower()}')))
+            for page_num in range(start_page, end_page + 1)
+        ]
         
-        # Convert each page
-        for page_num in range(start_page, end_page + 1):
-            page = doc[page_num]
-            
-            # Create matrix for scaling (DPI)
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
-            
-            # Render page to pixmap
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("png")
-            image = Image.open(io.BytesIO(img_data))
-            
-            # Convert to RGB if needed for JPEG
-            if output_format.upper() == 'JPEG' and image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Generate output path
-            output_path = file_path_obj.with_suffix(f'.page{page_num+1}.{output_format.lower()}')
-            
-            # Save image
-            save_kwargs = {}
-            if output_format.upper() == 'JPEG':
-                save_kwargs['quality'] = quality
-                save_kwargs['optimize'] = True
-            elif output_format.upper() == 'PNG':
-                save_kwargs['optimize'] = True
-            
-            image.save(output_path, format=output_format, **save_kwargs)
-            output_paths.append(str(output_path))
+        # Single pages are rendered in-process; spawning work would cost more than it saves
+        if len(jobs) == 1 or not use_pool:
+            return [
+                _render_page_mupdf(file_path, page_num, dpi, output_format, quality, output_path, session)
+                for page_num, output_path in jobs
+            ]
         
-        doc.close()
-        return output_paths
+        # Each worker re-opens the document: fitz.Document objects cannot be shared across processes
+        executor = get_forensics_executor()
+        futures = [
+            executor.submit(_render_page_mupdf, file_path, page_num, dpi, output_format, quality, output_path)
+            for page_num, output_path in jobs
+        ]
+        return [future.result() for future in futures]
         
     except Exception as e:
         raise PDFProcessingError(f"PDF to image conversion (PyMuPDF) failed: {str(e)}")
 
 
 def extract_text_from_pdf(file_path: str, 
-                         page_numbers: Optional[List[int]] = None) -> Dict[str, Any]:
+                         page_numbers: Optional[List[int]] = None,
+                         include_blocks: bool = False,
+                         session: Optional[PdfSession] = None) -> Dict[str, Any]:
     """
     Extract text from PDF pages.
     
     Args:
         file_path: Path to the PDF file
         page_numbers: List of page numbers to extract from (1-indexed), None for all pages
+        include_blocks: Whether to add positioned text blocks (page.get_text("dict"))
+            to each page; this is the most expensive extraction mode
+        session: Optional open PdfSession whose handles are reused
         
     Returns:
         Dictionary with extracted text and metadata
@@ -352,7 +794,7 @@ def extract_text_from_pdf(file_path: str,
     """
     try:
         # Validate PDF first
-        validate_pdf_file(file_path)
+        validate_pdf_file(file_path, session=session)
         
         result = {
             'pages': {},
@@ -362,9 +804,7 @@ def extract_text_from_pdf(file_path: str,
         
         # Extract with PyPDF2
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
+            with _pypdf2_reader(file_path, session) as pdf_reader:
                 pages_to_process = page_numbers or list(range(1, len(pdf_reader.pages) + 1))
                 
                 for page_num in pages_to_process:
@@ -375,62 +815,52 @@ def extract_text_from_pdf(file_path: str,
                             'text': text,
                             'method': 'PyPDF2'
                         }
-                        result['full_text'] += text + '\n'
                 
         except Exception as e:
             logger.warning(f"PyPDF2 text extraction failed: {str(e)}")
         
         # Extract with PyMuPDF (more accurate)
         try:
-            doc = fitz.open(file_path)
-            
-            pages_to_process = page_numbers or list(range(1, doc.page_count + 1))
-            
-            for page_num in pages_to_process:
-                if 1 <= page_num <= doc.page_count:
-                    page = doc[page_num - 1]
-                    text = page.get_text()
-                    
-                    # If we didn't get text from PyPDF2 or PyMuPDF is better
-                    if page_num not in result['pages'] or len(text) > len(result['pages'][page_num]['text']):
-                        result['pages'][page_num] = {
-                            'text': text,
-                            'method': 'PyMuPDF'
-                        }
-                    
-                    # Update full text (replace or append)
-                    if page_num not in result['pages'] or result['pages'][page_num]['method'] == 'PyMuPDF':
-                        # Rebuild full text with PyMuPDF version
-                        result['full_text'] = '\n'.join([
-                            result['pages'][p]['text'] for p in sorted(result['pages'].keys())
-                        ])
-            
-            # Get text blocks with position info
-            for page_num in pages_to_process:
-                if 1 <= page_num <= doc.page_count:
-                    page = doc[page_num - 1]
-                    blocks = page.get_text("dict")
-                    
-                    if page_num in result['pages']:
-                        result['pages'][page_num]['blocks'] = blocks
-            
-            doc.close()
+            with _mupdf_document(file_path, session) as doc:
+                pages_to_process = page_numbers or list(range(1, doc.page_count + 1))
+                
+                for page_num in pages_to_process:
+                    if 1 <= page_num <= doc.page_count:
+                        page = doc[page_num - 1]
+                        text = page.get_text()
+                        
+                        # If we didn't get text from PyPDF2 or PyMuPDF is better
+                        if page_num not in result['pages'] or len(text) > len(result['pages'][page_num]['text']):
+                            result['pages'][page_num] = {
+                                'text': text,
+                                'method': 'PyMuPDF'
+                            }
+                        
+                        # Get text blocks with position info from the already loaded page
+                        if include_blocks:
+                            result['pages'][page_num]['blocks'] = page.get_text("dict")
             
         except Exception as e:
             logger.warning(f"PyMuPDF text extraction failed: {str(e)}")
         
+        # Build full text once from the best text of each page, in page order
+        result['full_text'] = '\n'.join(
+            result['pages'][p]['text'] for p in sorted(result['pages'])
+        )
+        
         return result
         
     except Exception as e:
         raise PDFProcessingError(f"PDF text extraction failed: {str(e)}")
 
 
-def get_pdf_info(file_path: str) -> Dict[str, Any]:
+def get_pdf_info(file_path: str, session: Optional[PdfSession] = None) -> Dict[str, Any]:
     """
     Get comprehensive information about a PDF file.
     
     Args:
         file_path: Path to the PDF file
+        session: Optional open PdfSession shared by the validation and metadata steps
         
     Returns:
         Dictionary with PDF information
@@ -440,10 +870,10 @@ def get_pdf_info(file_path: str) -> Dict[str, Any]:
     """
     try:
         # Start with validation results
-        validation_result = validate_pdf_file(file_path)
+        validation_result = validate_pdf_file(file_path, session=session)
         
         # Add metadata
-        metadata = extract_pdf_metadata(file_path)
+        metadata = extract_pdf_metadata(file_path, session=session)
         
         # Combine all information
         info = {
@@ -467,15 +897,18 @@ def get_pdf_info(file_path: str) -> Dict[str, Any]:
 def convert_pdf_to_image_for_analysis(file_path: str, 
                                      page_number: int = 1,
                                      dpi: int = 300,
-                                     enhance_for_ocr: bool = True) -> str:
+                                     enhance_for_ocr: bool = True,
+                                     max_long_edge_px: Optional[int] = ANALYSIS_TARGET_LONG_EDGE_PX) -> str:
     """
     Convert a specific PDF page to an image optimized for analysis.
     
     Args:
         file_path: Path to the PDF file
         page_number: Page number to convert (1-indexed)
-        dpi: Resolution for conversion
+        dpi: Maximum resolution for conversion
         enhance_for_ocr: Whether to enhance the image for OCR
+        max_long_edge_px: Lower dpi so the page's long edge is at most this many
+            pixels; None always renders at dpi
         
     Returns:
         Path to the converted and enhanced image file
@@ -484,6 +917,28 @@ def convert_pdf_to_image_for_analysis(file_path: str,
         PDFProcessingError: If conversion fails
     """
     try:
+        # Enhance for analysis if requested: render, normalize and enhance in memory
+        # and encode once, instead of a JPEG round-trip through disk per stage
+        if enhance_for_ocr:
+            page_count = validate_pdf_file(file_path)['page_count']
+            if not 1 <= page_number <= page_count:
+                raise PDFProcessingError(f"Failed to convert PDF page {page_number}")
+            
+            image = _render_page_image(file_path, page_number - 1, dpi, max_long_edge_px)
+            enhanced_path = Path(file_path).with_suffix(f'.page{page_number}.enhanced.jpeg')
+            
+            return ProcessedImage(image).normalize('JPEG').enhance(
+                enhance_contrast=True,
+                enhance_sharpness=True,
+                enhance_brightness=False
+            ).save(enhanced_path, format='JPEG', quality=95, optimize=True, progressive=True)
+        
+        if max_long_edge_px:
+            with fitz.open(file_path) as doc:
+                if 1 <= page_number <= doc.page_count:
+                    rect = doc[page_number - 1].rect
+                    dpi = _fit_dpi(rect.width, rect.height, dpi, max_long_edge_px)
+        
         # Convert single page to image
         image_paths = convert_pdf_to_images(
             file_path,
@@ -497,32 +952,7 @@ def convert_pdf_to_image_for_analysis(file_path: str,
         if not image_paths:
             raise PDFProcessingError(f"Failed to convert PDF page {page_number}")
         
-        image_path = image_paths[0]
-        
-        # Enhance for analysis if requested
-        if enhance_for_ocr:
-            from .image_utils import enhance_image_quality, normalize_image_format
-            
-            # Normalize format
-            normalized_path = normalize_image_format(image_path, 'JPEG', quality=95)
-            
-            # Enhance for better OCR/analysis
-            enhanced_path = enhance_image_quality(
-                normalized_path,
-                enhance_contrast=True,
-                enhance_sharpness=True,
-                enhance_brightness=False
-            )
-            
-            # Clean up intermediate files
-            if image_path != normalized_path:
-                cleanup_temp_files([image_path])
-            if normalized_path != enhanced_path:
-                cleanup_temp_files([normalized_path])
-            
-            return enhanced_path
-        
-        return image_path
+        return image_paths[0]
         
     except Exception as e:
         raise PDFProcessingError(f"PDF to analysis image conversion failed: {str(e)}")
@@ -543,33 +973,42 @@ def is_pdf_file(file_path: str) -> bool:
         if not file_path.lower().endswith('.pdf'):
             return False
         
-        # Check file header
-        with open(file_path, 'rb') as f:
-            header = f.read(4)
-            return header == b'%PDF'
+        # Check file header with a raw, unbuffered read
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            header = os.read(fd, len(PDF_SIGNATURE))
+        finally:
+            os.close(fd)
+        
+        return header.startswith(PDF_SIGNATURE)
     
     except Exception:
         return False
 
 
-def get_pdf_page_count(file_path: str) -> int:
+@_cache_per_file_version()
+def get_pdf_page_count(file_path: str, session: Optional[PdfSession] = None) -> int:
     """
     Get the number of pages in a PDF file.
     
     Args:
         file_path: Path to the PDF file
+        session: Optional open PdfSession to read the count from
         
     Returns:
         Number of pages
         
     Raises:
+        PDFValidationError: If the file is not a PDF document
         PDFProcessingError: If unable to read PDF
     """
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            return len(pdf_reader.pages)
+        with _mupdf_document(file_path, session) as doc:
+            _ensure_pdf_document(doc)
+            return doc.page_count
     
+    except PDFValidationError:
+        raise
     except Exception as e:
         raise PDFProcessingError(f"Failed to get PDF page count: {str(e)}")
 
@@ -636,14 +1075,16 @@ def validate_and_process_pdf(file_path: str) -> Dict[str, Any]:
         PDFProcessingError: If processing fails
     """
     try:
-        # Validate PDF
-        validation_result = validate_pdf_file(file_path)
-        
-        if not validation_result['valid']:
-            raise PDFValidationError("PDF validation failed")
-        
-        # Get additional info
-        pdf_info = get_pdf_info(file_path)
+        # One open document serves validation and info gathering
+        with PdfSession(file_path) as session:
+            # Validate PDF
+            validation_result = validate_pdf_file(file_path, session=session)
+            
+            if not validation_result['valid']:
+                raise PDFValidationError("PDF validation failed")
+            
+            # Get additional info
+            pdf_info = get_pdf_info(file_path, session=session)
         
         # Determine optimal processing strategy
         processing_strategy = {
@@ -4,12 +4,18 @@ Redis connection utilities for distributed caching.
 
 import redis.asyncio as redis
 from typing import Optional, Any
-import json
+import numpy as np
+import orjson
+import ormsgpack
 import logging
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# One-byte prefixes identifying how a cached blob was encoded
+JSON_TAG = b'J'
+MSGPACK_TAG = b'M'
+
 
 class RedisConnection:
     """Singleton Redis connection manager with connection pooling."""
@@ -61,40 +67,66 @@ class RedisConnection:
                 logger.error(f"Error closing Redis pool: {e}")
 
 
-def serialize_value(value: Any) -> str:
-    """Serialize value to JSON string for Redis storage."""
+def serialize_value(value: Any) -> bytes:
+    """Serialize value to JSON bytes for Redis storage."""
     try:
         # Pydantic v2 models: store as JSON-friendly dict so cache hits return
         # structured data (not "field=value ..." string representations).
         if hasattr(value, "model_dump") and callable(getattr(value, "model_dump")):
-            return json.dumps(value.model_dump(mode="json"))
-        return json.dumps(value, default=str)
+            return JSON_TAG + orjson.dumps(value.model_dump(mode="json"))
+        # orjson emits bytes directly, which Redis stores without re-encoding
+        return JSON_TAG + orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
     except (TypeError, ValueError) as e:
         logger.error(f"Failed to serialize value {type(value)}: {e}")
         # Fallback to string representation
-        return str(value)
+        return str(value).encode('utf-8')
 
 
 def deserialize_value(value: bytes) -> Any:
-    """Deserialize JSON string from Redis to Python object."""
+    """Deserialize JSON bytes from Redis to Python object."""
     if value is None:
         return None
         
     try:
-        # Convert bytes to string
-        if isinstance(value, bytes):
-            value_str = value.decode('utf-8')
-        else:
-            value_str = value
-            
-        # Try to parse as JSON
-        return json.loads(value_str)
+        # Dispatch on the type tag; untagged values are JSON written before tagging.
+        # Valid JSON never starts with either tag byte, so this is unambiguous.
+        if value[:1] == MSGPACK_TAG:
+            return deserialize_value_binary(value)
+        if value[:1] == JSON_TAG:
+            value = value[1:]
         
-    except (json.JSONDecodeError, UnicodeDecodeError):
+        # orjson parses bytes directly, no intermediate str decode
+        return orjson.loads(value)
+        
+    except (orjson.JSONDecodeError, UnicodeDecodeError):
         # Fallback: return as decoded string for backward compatibility
         if isinstance(value, bytes):
             return value.decode('utf-8')
         return value
     except Exception as e:
         logger.error(f"Failed to deserialize value: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def serialize_value_binary(value: Any) -> bytes:
+    """Serialize binary/numeric payloads (bytes, numpy arrays) to tagged msgpack."""
+    return MSGPACK_TAG + ormsgpack.packb(value, option=ormsgpack.OPT_SERIALIZE_NUMPY)
+
+
+def deserialize_value_binary(value: bytes) -> Any:
+    """Deserialize a msgpack value written by serialize_value_binary."""
+    if value is None:
+        return None
+    
+    return ormsgpack.unpackb(value[1:] if value[:1] == MSGPACK_TAG else value)
+
+
+def is_binary_payload(value: Any) -> bool:
+    """
+    Whether a value should be cached with msgpack rather than JSON.
+    
+    Only raw bytes and numpy arrays qualify; other array-like objects (e.g. PIL
+    images) are not msgpack-serializable and go through the JSON path.
+    """
+    return isinstance(value, (bytes, bytearray, memoryview, np.ndarray))
+
@@ -1,6 +1,10 @@
-import tempfile
+import asyncio
+import io
 import logging
-from typing import Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 import magic
 from PIL import Image
@@ -10,6 +14,13 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Leading bytes handed to libmagic for MIME sniffing
+MAGIC_SNIFF_BYTES = 2048
+
+# Content-derived validation results are memoized by SHA-256 for repeat uploads
+VALIDATION_CACHE_SIZE = 1024
+VALIDATION_CACHE_TTL = 300.0
+
 
 class SecurityValidationError(Exception):
     """Exception raised for security validation errors."""
@@ -37,6 +48,13 @@ class FileSecurityValidator:
         b'RIFF': 'image/webp',  # Note: WebP has WEBP in bytes 8-11
     }
     
+    # Signatures keyed by their first two bytes (unique across the table), so
+    # detection is one dict lookup instead of a scan over every signature
+    _SIGNATURE_INDEX = {
+        signature[:2]: (signature, mime_type)
+        for signature, mime_type in ALLOWED_SIGNATURES.items()
+    }
+    
     # Maximum file sizes per type (in bytes)
     MAX_FILE_SIZES = {
         'image/jpeg': 50 * 1024 * 1024,  # 50MB
@@ -47,6 +65,37 @@ class FileSecurityValidator:
         'application/pdf': 20 * 1024 * 1024,  # 20MB
     }
     
+    # MIME types accepted for upload
+    ALLOWED_TYPES = frozenset(MAX_FILE_SIZES)
+    
+    # Common libmagic MIME variations mapped to canonical types
+    MIME_MAPPINGS = {
+        'image/jpeg': 'image/jpeg',
+        'image/jpg': 'image/jpeg',
+        'image/png': 'image/png',
+        'image/tiff': 'image/tiff',
+        'image/bmp': 'image/bmp',
+        'image/webp': 'image/webp',
+        'application/pdf': 'application/pdf',
+    }
+    
+    # Client-declared MIME aliases
+    MIME_ALIASES = {
+        'image/jpg': 'image/jpeg',
+    }
+    
+    # Last-resort detection by file extension
+    EXTENSION_MAPPINGS = {
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.png': 'image/png',
+        '.pdf': 'application/pdf',
+        '.tiff': 'image/tiff',
+        '.tif': 'image/tiff',
+        '.bmp': 'image/bmp',
+        '.webp': 'image/webp',
+    }
+    
     def __init__(self):
         """Initialize the security validator."""
         try:
@@ -56,11 +105,44 @@ class FileSecurityValidator:
         except Exception as e:
             logger.warning(f"python-magic not available, falling back to manual validation: {e}")
             self.magic_available = False
+        
+        # libmagic handles are not safe to share between threads
+        self._magic_lock = threading.Lock()
+        
+        # SHA-256 -> (expires_at, actual MIME type, deep validation details)
+        self._validation_cache: "OrderedDict[str, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+
+    def _cache_get(self, file_hash: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get memoized content validation for a hash if present and fresh."""
+        with self._validation_cache_lock:
+            entry = self._validation_cache.get(file_hash)
+            if entry is None:
+                return None
+            
+            expires_at, mime_type, details = entry
+            if expires_at <= time.monotonic():
+                del self._validation_cache[file_hash]
+                return None
+            
+            self._validation_cache.move_to_end(file_hash)
+            return mime_type, dict(details)
+
+    def _cache_set(self, file_hash: str, mime_type: str, details: Dict[str, Any]) -> None:
+        """Memoize content validation, evicting the least recently used hash."""
+        with self._validation_cache_lock:
+            self._validation_cache[file_hash] = (time.monotonic() + VALIDATION_CACHE_TTL, mime_type, dict(details))
+            self._validation_cache.move_to_end(file_hash)
+            while len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
 
     async def validate_file_content(self, file_content: bytes, filename: str, declared_mime_type: str) -> Dict[str, Any]:
         """
         Validate file content using basic security checks only.
         
+        Hashing and content inspection run in worker threads so the event loop
+        stays responsive; identical content is served from the SHA-256 cache.
+        
         Args:
             file_content: Raw file content bytes
             filename: Original filename
@@ -78,17 +160,20 @@ class FileSecurityValidator:
         file_size = len(file_content)
         self._validate_file_size(file_size, declared_mime_type)
         
-        # Detect actual MIME type from content
-        actual_mime_type = self._detect_mime_type(file_content, filename)
-        
-        # Validate MIME type consistency
-        self._validate_mime_type_consistency(declared_mime_type, actual_mime_type, filename)
-        
-        # Perform deep content validation
-        validation_result = await self._deep_content_validation(file_content, actual_mime_type, filename)
+        # Calculate file hash for integrity tracking; it doubles as the cache key.
+        # hashlib releases the GIL on large buffers, so the thread does not stall the loop
+        file_hash = (await asyncio.to_thread(hashlib.sha256, file_content)).hexdigest()
         
-        # Calculate file hash for integrity tracking
-        file_hash = hashlib.sha256(file_content).hexdigest()
+        cached = self._cache_get(file_hash)
+        if cached is not None:
+            # Identical content was already parsed; only the per-request checks remain
+            actual_mime_type, validation_result = cached
+            self._validate_mime_type_consistency(declared_mime_type, actual_mime_type, filename)
+        else:
+            actual_mime_type, validation_result = await asyncio.to_thread(
+                self._inspect_file_content, file_content, filename, declared_mime_type
+            )
+            self._cache_set(file_hash, actual_mime_type, validation_result)
         
         result = {
             'filename': filename,
@@ -103,6 +188,19 @@ class FileSecurityValidator:
         logger.info(f"File validation passed for: {filename}")
         return result
 
+    def _inspect_file_content(self, file_content: bytes, filename: str,
+                              declared_mime_type: str) -> Tuple[str, Dict[str, Any]]:
+        """Detect the actual MIME type and deep-validate the content (the uncached part)."""
+        # Detect actual MIME type from content
+        actual_mime_type = self._detect_mime_type(file_content, filename)
+        
+        # Validate MIME type consistency
+        self._validate_mime_type_consistency(declared_mime_type, actual_mime_type, filename)
+        
+        # Perform deep content validation
+        validation_result = self._deep_content_validation(file_content, actual_mime_type, filename)
+        return actual_mime_type, validation_result
+
     def _validate_file_size(self, file_size: int, mime_type: str) -> None:
         """Validate file size against type-specific limits."""
         if file_size == 0:
@@ -118,53 +216,31 @@ class FileSecurityValidator:
     def _detect_mime_type(self, file_content: bytes, filename: str) -> str:
         """Detect MIME type from file content using magic numbers."""
         # Check magic numbers first
-        for signature, mime_type in self.ALLOWED_SIGNATURES.items():
+        entry = self._SIGNATURE_INDEX.get(file_content[:2])
+        if entry is not None:
+            signature, mime_type = entry
             if file_content.startswith(signature):
-                # Special case for WebP - need to check additional bytes
-                if mime_type == 'image/webp' and len(file_content) >= 12:
-                    if file_content[8:12] == b'WEBP':
-                        return mime_type
-                elif mime_type != 'image/webp':
+                # Special case for WebP - RIFF is only WebP with WEBP in bytes 8-11
+                if mime_type != 'image/webp' or file_content[8:12] == b'WEBP':
                     return mime_type
         
         # Use python-magic if available
         if self.magic_available:
             try:
-                with tempfile.NamedTemporaryFile() as temp_file:
-                    temp_file.write(file_content)
-                    temp_file.flush()
-                    detected_mime = self.magic_mime.from_file(temp_file.name)
-                    
-                    # Map common variations
-                    mime_mappings = {
-                        'image/jpeg': 'image/jpeg',
-                        'image/jpg': 'image/jpeg',
-                        'image/png': 'image/png',
-                        'image/tiff': 'image/tiff',
-                        'image/bmp': 'image/bmp',
-                        'image/webp': 'image/webp',
-                        'application/pdf': 'application/pdf',
-                    }
-                    
-                    return mime_mappings.get(detected_mime, detected_mime)
-                    
+                # libmagic only inspects the leading bytes; a bounded slice avoids
+                # a full-file temp write and libmagic's large-buffer allocation errors
+                with self._magic_lock:
+                    detected_mime = self.magic_mime.from_buffer(bytes(file_content[:MAGIC_SNIFF_BYTES]))
+                
+                # Map common variations
+                return self.MIME_MAPPINGS.get(detected_mime, detected_mime)
+                
             except Exception as e:
                 logger.warning(f"Magic MIME detection failed: {e}")
         
         # Fallback to extension-based detection
         extension = Path(filename).suffix.lower()
-        extension_mappings = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.pdf': 'application/pdf',
-            '.tiff': 'image/tiff',
-            '.tif': 'image/tiff',
-            '.bmp': 'image/bmp',
-            '.webp': 'image/webp',
-        }
-        
-        detected_type = extension_mappings.get(extension)
+        detected_type = self.EXTENSION_MAPPINGS.get(extension)
         if not detected_type:
             raise SecurityValidationError(f"Unsupported file type: {extension}")
         
@@ -173,12 +249,8 @@ class FileSecurityValidator:
     def _validate_mime_type_consistency(self, declared: str, actual: str, filename: str) -> None:
         """Validate that declared and actual MIME types are consistent."""
         # Normalize MIME types
-        mime_aliases = {
-            'image/jpg': 'image/jpeg',
-        }
-        
-        normalized_declared = mime_aliases.get(declared, declared)
-        normalized_actual = mime_aliases.get(actual, actual)
+        normalized_declared = self.MIME_ALIASES.get(declared, declared)
+        normalized_actual = self.MIME_ALIASES.get(actual, actual)
         
         if normalized_declared != normalized_actual:
             raise SecurityValidationError(
@@ -186,13 +258,12 @@ class FileSecurityValidator:
             )
         
         # Validate against allowed types
-        allowed_types = set(self.MAX_FILE_SIZES.keys())
-        if normalized_actual not in allowed_types:
+        if normalized_actual not in self.ALLOWED_TYPES:
             raise SecurityValidationError(
-                f"Unsupported MIME type: {actual}. Allowed types: {', '.join(allowed_types)}"
+                f"Unsupported MIME type: {actual}. Allowed types: {', '.join(self.ALLOWED_TYPES)}"
             )
 
-    async def _deep_content_validation(self, file_content: bytes, mime_type: str, filename: str) -> Dict[str, Any]:
+    def _deep_content_validation(self, file_content: bytes, mime_type: str, filename: str) -> Dict[str, Any]:
         """Perform deep content validation specific to file type."""
         if mime_type.startswith('image/'):
             return self._validate_image_content(file_content, mime_type, filename)
@@ -204,63 +275,54 @@ class FileSecurityValidator:
     def _validate_image_content(self, file_content: bytes, mime_type: str, filename: str) -> Dict[str, Any]:
         """Validate image content using PIL."""
         try:
-            with tempfile.NamedTemporaryFile() as temp_file:
-                temp_file.write(file_content)
-                temp_file.flush()
+            # Try to open and validate with PIL, straight from memory
+            with Image.open(io.BytesIO(file_content)) as img:
+                # Verify image can be loaded
+                img.verify()
+            
+            # Re-open for getting info (verify() closes the image)
+            with Image.open(io.BytesIO(file_content)) as img:
+                width, height = img.size
+                format_name = img.format
+                mode = img.mode
                 
-                # Try to open and validate with PIL
-                with Image.open(temp_file.name) as img:
-                    # Verify image can be loaded
-                    img.verify()
+                # Sanity checks
+                if width <= 0 or height <= 0:
+                    raise SecurityValidationError(f"Invalid image dimensions: {width}x{height}")
                 
-                # Re-open for getting info (verify() closes the image)
-                with Image.open(temp_file.name) as img:
-                    width, height = img.size
-                    format_name = img.format
-                    mode = img.mode
-                    
-                    # Sanity checks
-                    if width <= 0 or height <= 0:
-                        raise SecurityValidationError(f"Invalid image dimensions: {width}x{height}")
-                    
-                    if width > 50000 or height > 50000:
-                        raise SecurityValidationError(f"Image dimensions too large: {width}x{height}")
-                    
-                    return {
-                        'width': width,
-                        'height': height,
-                        'format': format_name,
-                        'mode': mode,
-                        'validation_method': 'PIL'
-                    }
-                    
+                if width > 50000 or height > 50000:
+                    raise SecurityValidationError(f"Image dimensions too large: {width}x{height}")
+                
+                return {
+                    'width': width,
+                    'height': height,
+                    'format': format_name,
+                    'mode': mode,
+                    'validation_method': 'PIL'
+                }
+            
         except Exception as e:
             raise SecurityValidationError(f"Image validation failed for {filename}: {str(e)}")
 
     def _validate_pdf_content(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """Validate PDF content."""
         try:
-            with tempfile.NamedTemporaryFile() as temp_file:
-                temp_file.write(file_content)
-                temp_file.flush()
-                
-                # Try to read with PyPDF2
-                with open(temp_file.name, 'rb') as pdf_file:
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-                    
-                    page_count = len(pdf_reader.pages)
-                    
-                    if page_count <= 0:
-                        raise SecurityValidationError("PDF has no pages")
-                    
-                    if page_count > 100:  # Reasonable limit
-                        raise SecurityValidationError(f"PDF has too many pages: {page_count}")
-                    
-                    return {
-                        'page_count': page_count,
-                        'validation_method': 'PyPDF2'
-                    }
-                    
+            # Parse straight from memory; only the page tree is read, no page content
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content), strict=False)
+            
+            page_count = len(pdf_reader.pages)
+            
+            if page_count <= 0:
+                raise SecurityValidationError("PDF has no pages")
+            
+            if page_count > 100:  # Reasonable limit
+                raise SecurityValidationError(f"PDF has too many pages: {page_count}")
+            
+            return {
+                'page_count': page_count,
+                'validation_method': 'PyPDF2'
+            }
+            
         except SecurityValidationError:
             raise
         except Exception as e:
@@ -271,12 +333,22 @@ class FileSecurityValidator:
 security_validator = FileSecurityValidator()
 
 
-async def validate_upload_security(file: UploadFile) -> Dict[str, Any]:
+def read_upload_content(file: UploadFile) -> bytes:
+    """Read the whole upload, leaving the file positioned at the start for later readers."""
+    file.file.seek(0)  # Ensure we're at the beginning
+    file_content = file.file.read()
+    file.file.seek(0)  # Reset for any subsequent reads
+    return file_content
+
+
+async def validate_upload_security_async(file: UploadFile,
+                                         file_content: Optional[bytes] = None) -> Dict[str, Any]:
     """
     Validate uploaded file for basic security checks only.
     
     Args:
         file: FastAPI UploadFile object
+        file_content: The upload's bytes if the caller has already read them
         
     Returns:
         Dictionary with validation results
@@ -286,23 +358,20 @@ async def validate_upload_security(file: UploadFile) -> Dict[str, Any]:
         HTTPException: If file cannot be processed
     """
     try:
-        # Read file content
-        file.file.seek(0)  # Ensure we're at the beginning
-        file_content = file.file.read()
-        file.file.seek(0)  # Reset for any subsequent reads
+        # Read file content unless the caller already has it
+        if file_content is None:
+            file_content = read_upload_content(file)
         
         if not file_content:
             raise SecurityValidationError("File is empty")
         
         # Perform basic security validation only
-        result = await security_validator.validate_file_content(
+        return await security_validator.validate_file_content(
             file_content=file_content,
             filename=file.filename or "unknown",
             declared_mime_type=file.content_type or "application/octet-stream"
         )
         
-        return result
-        
     except SecurityValidationError:
         raise
     except Exception as e:
@@ -310,4 +379,4 @@ async def validate_upload_security(file: UploadFile) -> Dict[str, Any]:
         raise HTTPException(
             status_code=500,
             detail="File security validation failed"
-        )
\ No newline at end of file
+        )
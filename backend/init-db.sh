@@ -12,19 +12,27 @@ NC='\033[0m'
 
 echo -e "${YELLOW}🔄 Initializing FraudCheck database...${NC}"
 
+# Capped exponential backoff with jitter: 0.1s, 0.2s, 0.4s ... up to 5s
+backoff_sleep() {
+    sleep "$(awk -v d="$delay" -v r="$RANDOM" 'BEGIN { print d + (r % 100) / 1000 }')"
+    delay=$(awk -v d="$delay" 'BEGIN { d *= 2; print (d > 5 ? 5 : d) }')
+}
+
 # Wait for PostgreSQL to be ready
 echo -e "${YELLOW}⏳ Waiting for PostgreSQL to be ready...${NC}"
-while ! pg_isready -h postgres -p 5432 -U FraudCheck; do
+delay=0.1
+while ! pg_isready -h postgres -p 5432 -U FraudCheck -t 2; do
     echo -e "${YELLOW}   PostgreSQL is not ready yet, waiting...${NC}"
-    sleep 2
+    backoff_sleep
 done
 echo -e "${GREEN}✅ PostgreSQL is ready${NC}"
 
 # Wait for LocalStack to be ready  
 echo -e "${YELLOW}⏳ Waiting for LocalStack to be ready...${NC}"
-while ! curl -f http://localstack:4566/_localstack/health >/dev/null 2>&1; do
+delay=0.1
+while ! curl -f --max-time 2 http://localstack:4566/_localstack/health >/dev/null 2>&1; do
     echo -e "${YELLOW}   LocalStack is not ready yet, waiting...${NC}"
-    sleep 2
+    backoff_sleep
 done
 echo -e "${GREEN}✅ LocalStack is ready${NC}"
 
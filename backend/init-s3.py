@@ -5,6 +5,7 @@ This script creates the necessary S3 bucket in LocalStack for development
 """
 
 import boto3
+import json
 import os
 from botocore.exceptions import ClientError
 
@@ -62,7 +63,7 @@ def main():
                     try:
                         s3_client.put_bucket_policy(
                             Bucket=bucket_name,
-                            Policy=str(bucket_policy).replace("'", '"')
+                            Policy=json.dumps(bucket_policy)
                         )
                         print(f"✅ Bucket policy set for '{bucket_name}'")
                     except Exception as policy_error:
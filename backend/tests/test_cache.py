@@ -0,0 +1,53 @@
+import asyncio
+
+import numpy as np
+from PIL import Image
+
+from app.utils.cache import DistributedCache
+from app.utils.redis_cache import JSON_TAG, MSGPACK_TAG, is_binary_payload
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+    
+    def __init__(self):
+        self.store = {}
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def make_cache():
+    cache = DistributedCache()
+    cache._redis = FakeRedis()
+    return cache
+
+
+def test_is_binary_payload_accepts_bytes_and_ndarrays_only():
+    assert is_binary_payload(b"raw")
+    assert is_binary_payload(bytearray(b"raw"))
+    assert is_binary_payload(memoryview(b"raw"))
+    assert is_binary_payload(np.arange(3))
+    assert not is_binary_payload(Image.new("RGB", (2, 2)))
+    assert not is_binary_payload({"a": 1})
+
+
+def test_set_numpy_array_uses_msgpack():
+    cache = make_cache()
+    asyncio.run(cache.set("array", np.arange(3), 60))
+    
+    assert cache._redis.store["array"][:1] == MSGPACK_TAG
+    assert asyncio.run(cache.get("array")) == [0, 1, 2]
+
+
+def test_set_unsupported_object_falls_back_to_json():
+    cache = make_cache()
+    image = Image.new("RGB", (2, 2))
+    
+    asyncio.run(cache.set("image", image, 60))
+    
+    assert cache._redis.store["image"][:1] == JSON_TAG
+    assert asyncio.run(cache.get("image")) == str(image)
@@ -0,0 +1,52 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import fitz
+import pytest
+
+from app.utils import pdf_utils
+
+
+@pytest.fixture
+def three_page_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for number in range(3):
+        page = doc.new_page(width=200, height=300)
+        page.insert_text((20, 40), f"Page {number + 1}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def recording_pool(monkeypatch):
+    """Real process pool standing in for the shared forensics executor, counting submits."""
+    submitted = []
+    
+    class RecordingPool(ProcessPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(fn, *args, **kwargs)
+    
+    pool = RecordingPool(max_workers=2)
+    monkeypatch.setattr(pdf_utils, "get_forensics_executor", lambda: pool)
+    yield submitted
+    pool.shutdown(wait=True)
+
+
+def test_convert_mupdf_renders_pages_on_shared_pool(three_page_pdf, recording_pool):
+    paths = pdf_utils.convert_pdf_to_images_mupdf(three_page_pdf, dpi=50, use_pool=True)
+    
+    assert len(recording_pool) == 3
+    assert [Path(p).name for p in paths] == [
+        "sample.page1.jpeg", "sample.page2.jpeg", "sample.page3.jpeg"
+    ]
+    assert all(Path(p).stat().st_size > 0 for p in paths)
+
+
+def test_convert_mupdf_without_pool_renders_in_process(three_page_pdf, recording_pool):
+    paths = pdf_utils.convert_pdf_to_images_mupdf(three_page_pdf, dpi=50, use_pool=False)
+    
+    assert recording_pool == []
+    assert len(paths) == 3